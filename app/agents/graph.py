@@ -1,18 +1,22 @@
 """LangGraph workflow definition."""
 
-from typing import Any, Literal
+import functools
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, Literal
 
 from langgraph.graph import END, StateGraph
+from langgraph.types import Send
 
 from app.agents.nodes import (
-    compare_node,
-    crawl_node,
-    extract_node,
+    aggregate_entities,
+    crawl_one,
+    extract_one_page,
     filter_urls_node,
     plan_node,
     report_node,
     search_node,
 )
+from app.agents.nodes.extract import build_prompt_header
 from app.agents.state import AgentState
 from app.core.errors import StepLimitExceededError
 from app.core.logging import get_logger
@@ -44,118 +48,72 @@ def check_step_limit(state: AgentState) -> Literal["continue", "stop"]:
     return "continue"
 
 
-def should_continue_after_plan(state: AgentState) -> Literal["search", "stop"]:
-    """Decide whether to continue after planning.
-    
-    Args:
-        state: Current agent state
-        
-    Returns:
-        Next node or stop
-    """
-    if check_step_limit(state) == "stop":
-        return "stop"
-    
-    # Check if plan was created successfully
-    if not state.get("plan"):
-        logger.warning("plan_missing", job_id=state.get("job_id"))
-        return "stop"
-    
-    return "search"
+def _make_router(
+    next_node: str,
+    state_key: str | None = None,
+    warn_event: str | None = None,
+) -> Callable[[AgentState], str]:
+    """Build a conditional-edge router.
 
+    Every router checks the step limit and optionally that a state key
+    holds a truthy value before advancing; this factory replaces the
+    near-identical per-edge functions.
 
-def should_continue_after_search(state: AgentState) -> Literal["filter", "stop"]:
-    """Decide whether to continue after search.
-    
     Args:
-        state: Current agent state
-        
+        next_node: Node to route to when checks pass
+        state_key: Optional state key that must be non-empty
+        warn_event: Log event emitted when state_key is empty
+
     Returns:
-        Next node or stop
+        Router function for add_conditional_edges
     """
-    if check_step_limit(state) == "stop":
-        return "stop"
-    
-    # Check if URLs were found
-    if not state.get("urls"):
-        logger.warning("no_urls_found", job_id=state.get("job_id"))
-        return "stop"
-    
-    return "filter"
 
+    def _router(state: AgentState) -> str:
+        if check_step_limit(state) == "stop":
+            return "stop"
 
-def should_continue_after_filter(state: AgentState) -> Literal["crawl", "stop"]:
-    """Decide whether to continue after filtering.
-    
-    Args:
-        state: Current agent state
-        
-    Returns:
-        Next node or stop
-    """
-    if check_step_limit(state) == "stop":
-        return "stop"
-    
-    # Check if filtered URLs exist
-    if not state.get("filtered_urls"):
-        logger.warning("no_filtered_urls", job_id=state.get("job_id"))
-        return "stop"
-    
-    return "crawl"
+        if state_key and not state.get(state_key):
+            logger.warning(warn_event, job_id=state.get("job_id"))
+            return "stop"
 
+        return next_node
 
-def should_continue_after_crawl(state: AgentState) -> Literal["extract", "stop"]:
-    """Decide whether to continue after crawling.
-    
-    Args:
-        state: Current agent state
-        
-    Returns:
-        Next node or stop
-    """
-    if check_step_limit(state) == "stop":
-        return "stop"
-    
-    # Check if any pages were crawled successfully
-    pages = state.get("pages", [])
-    successful_pages = [p for p in pages if p.get("success", False)]
-    
-    if not successful_pages:
-        logger.warning("no_successful_crawls", job_id=state.get("job_id"))
-        return "stop"
-    
-    return "extract"
+    return _router
 
 
-def should_continue_after_extract(state: AgentState) -> Literal["compare", "stop"]:
-    """Decide whether to continue after extraction.
-    
+def route_to_crawlers(state: AgentState) -> list[Send] | Literal["stop"]:
+    """Fan out each filtered URL to a parallel crawl branch.
+
     Args:
         state: Current agent state
-        
+
     Returns:
-        Next node or stop
+        One Send per filtered URL, or stop
     """
     if check_step_limit(state) == "stop":
         return "stop"
-    
-    # Continue even if no entities (will generate empty report)
-    return "compare"
 
-
-def should_continue_after_compare(state: AgentState) -> Literal["report", "stop"]:
-    """Decide whether to continue after comparison.
-    
-    Args:
-        state: Current agent state
-        
-    Returns:
-        Next node or stop
-    """
-    if check_step_limit(state) == "stop":
+    filtered_urls = state.get("filtered_urls", [])
+    if not filtered_urls:
+        logger.warning("no_filtered_urls", job_id=state.get("job_id"))
         return "stop"
-    
-    return "report"
+
+    # Build the job-scoped prompt header once for all branches
+    plan = state.get("plan", {})
+    prompt_header = build_prompt_header(plan)
+
+    return [
+        Send(
+            "crawl_one",
+            {
+                "url": url,
+                "plan": plan,
+                "job_id": state["job_id"],
+                "prompt_header": prompt_header,
+            },
+        )
+        for url in filtered_urls
+    ]
 
 
 def create_research_graph() -> StateGraph:
@@ -171,9 +129,17 @@ def create_research_graph() -> StateGraph:
     workflow.add_node("plan", plan_node)
     workflow.add_node("search", search_node)
     workflow.add_node("filter", filter_urls_node)
-    workflow.add_node("crawl", crawl_node)
-    workflow.add_node("extract", extract_node)
-    workflow.add_node("compare", compare_node)
+    # Failed/off-topic branches route to aggregate so the deferred
+    # fan-in fires even when nothing reaches extraction
+    workflow.add_node(
+        "crawl_one", crawl_one, destinations=("extract_one_page", "aggregate")
+    )
+    workflow.add_node("extract_one_page", extract_one_page)
+    # Deferred fan-in: fires only after every extract branch has landed,
+    # then dispatches straight to report via Command
+    workflow.add_node(
+        "aggregate", aggregate_entities, defer=True, destinations=("report",)
+    )
     workflow.add_node("report", report_node)
     
     # Set entry point
@@ -182,57 +148,34 @@ def create_research_graph() -> StateGraph:
     # Add conditional edges
     workflow.add_conditional_edges(
         "plan",
-        should_continue_after_plan,
+        _make_router("search", "plan", "plan_missing"),
         {
             "search": "search",
             "stop": END,
         },
     )
-    
+
     workflow.add_conditional_edges(
         "search",
-        should_continue_after_search,
+        _make_router("filter", "urls", "no_urls_found"),
         {
             "filter": "filter",
             "stop": END,
         },
     )
-    
+
+    # Fan out: one crawl branch per URL (Send API); each successful
+    # branch forwards its page straight to extract_one_page via Command.
+    # Fan in: branches join on the pages/entities channels before compare.
     workflow.add_conditional_edges(
         "filter",
-        should_continue_after_filter,
-        {
-            "crawl": "crawl",
-            "stop": END,
-        },
-    )
-    
-    workflow.add_conditional_edges(
-        "crawl",
-        should_continue_after_crawl,
-        {
-            "extract": "extract",
-            "stop": END,
-        },
-    )
-    
-    workflow.add_conditional_edges(
-        "extract",
-        should_continue_after_extract,
+        route_to_crawlers,
         {
-            "compare": "compare",
-            "stop": END,
-        },
-    )
-    
-    workflow.add_conditional_edges(
-        "compare",
-        should_continue_after_compare,
-        {
-            "report": "report",
             "stop": END,
         },
     )
+
+    workflow.add_edge("extract_one_page", "aggregate")
     
     # Report is the final node
     workflow.add_edge("report", END)
@@ -241,18 +184,18 @@ def create_research_graph() -> StateGraph:
     return workflow.compile()
 
 
-# Global graph instance
-_research_graph: Any | None = None
-
-
+@functools.lru_cache(maxsize=1)
 def get_research_graph() -> Any:
     """Get the compiled research graph.
-    
+
     Returns:
         Compiled research graph
     """
-    global _research_graph
-    if _research_graph is None:
-        _research_graph = create_research_graph()
-        logger.info("research_graph_compiled")
-    return _research_graph
+    graph = create_research_graph()
+    logger.info("research_graph_compiled")
+    return graph
+
+
+# Warm the cache at import so the first request doesn't pay compile cost
+if not TYPE_CHECKING:
+    get_research_graph()
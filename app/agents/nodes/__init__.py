@@ -1,8 +1,8 @@
 """Nodes package initialization."""
 
-from app.agents.nodes.compare import compare_node
-from app.agents.nodes.crawl import crawl_node
-from app.agents.nodes.extract import extract_node
+from app.agents.nodes.compare import aggregate_entities
+from app.agents.nodes.crawl import crawl_one
+from app.agents.nodes.extract import extract_one_page
 from app.agents.nodes.filter_urls import filter_urls_node
 from app.agents.nodes.plan import plan_node
 from app.agents.nodes.report import report_node
@@ -12,8 +12,8 @@ __all__ = [
     "plan_node",
     "search_node",
     "filter_urls_node",
-    "crawl_node",
-    "extract_node",
-    "compare_node",
+    "crawl_one",
+    "extract_one_page",
+    "aggregate_entities",
     "report_node",
 ]
@@ -1,87 +1,113 @@
-"""Crawl node: Crawl URLs and extract content."""
+"""Crawl node: Crawl URLs and extract content.
 
+Each filtered URL is dispatched as an independent parallel branch via
+the LangGraph Send API. A branch that yields a successful, on-topic page
+hands it straight to extraction with Command(goto=Send(...)), so slow
+pages never hold back extraction of fast ones.
+"""
+
+import asyncio
 from typing import Any
 
-from app.agents.state import AgentState
+from langgraph.types import Command, Send
+
+from app.agents.nodes.extract import page_mentions_canonical
+from app.agents.state import CrawlBranchState
+from app.core.config import get_settings
+from app.core.errors import CrawlError
 from app.core.logging import get_logger
 from app.tools.crawl import get_crawl_tool
 
 logger = get_logger(__name__)
 
 
-async def crawl_node(state: AgentState) -> dict[str, Any]:
-    """Crawl filtered URLs.
-    
+# Shared across parallel Send branches to bound concurrent fetches
+_crawl_semaphore: asyncio.Semaphore | None = None
+
+
+def _get_crawl_semaphore() -> asyncio.Semaphore:
+    """Get the shared crawl semaphore.
+
+    Returns:
+        Semaphore bounding concurrent page fetches
+    """
+    global _crawl_semaphore
+    if _crawl_semaphore is None:
+        _crawl_semaphore = asyncio.Semaphore(get_settings().max_crawl_concurrency)
+    return _crawl_semaphore
+
+
+async def crawl_one(state: CrawlBranchState) -> Command[Any]:
+    """Crawl a single URL as one parallel branch.
+
+    Successful on-topic pages are forwarded directly to extract_one_page
+    so extraction overlaps with still-running crawls; failed or off-topic
+    pages record their page/error state and route to the deferred
+    aggregate fan-in, so report still runs when no page reaches
+    extraction.
+
     Args:
-        state: Current agent state
-        
+        state: Branch input with `url`, `plan`, `job_id` and `prompt_header`
+
     Returns:
-        Updated state with crawled pages
+        Command updating the pages channel, routing to extraction or
+        straight to the fan-in
     """
     job_id = state["job_id"]
-    filtered_urls = state.get("filtered_urls", [])
-    
-    logger.info("crawl_node_started", job_id=job_id, url_count=len(filtered_urls))
-    
+    url = state["url"]
+    plan = state.get("plan", {})
+
     try:
         crawl_tool = get_crawl_tool()
-        
-        # Crawl all URLs with concurrency control
-        crawl_results = await crawl_tool.crawl_urls(filtered_urls)
-        
-        # Convert to page dictionaries
-        pages = []
-        for result in crawl_results:
-            page_data = {
-                "url": result.url,
-                "title": result.title,
-                "content": result.content,
-                "extra_metadata": result.extra_metadata,
-                "success": result.success,
-                "error": result.error,
-            }
-            pages.append(page_data)
-        
-        success_count = sum(1 for p in pages if p["success"])
-        failed_count = len(pages) - success_count
-        
-        logger.info(
-            "crawl_node_completed",
-            job_id=job_id,
-            total=len(pages),
-            success=success_count,
-            failed=failed_count,
-        )
-        
-        # Track failures as errors but don't fail the entire node
-        errors = state.get("errors", [])
-        for page in pages:
-            if not page["success"]:
-                errors.append({
-                    "node": "crawl",
-                    "url": page["url"],
-                    "error": page["error"],
-                    "error_type": "CrawlError",
-                })
-        
-        return {
-            "pages": pages,
-            "errors": errors,
-            "step_count": state.get("step_count", 0) + 1,
-            "progress": f"Crawled {success_count}/{len(pages)} pages successfully",
+        async with _get_crawl_semaphore():
+            result = await crawl_tool.crawl_url(url)
+        page_data = {
+            "url": result.url,
+            "title": result.title,
+            "content": result.content,
+            "extra_metadata": result.extra_metadata,
+            "success": result.success,
+            "error": result.error,
         }
-        
-    except Exception as e:
-        logger.error("crawl_node_failed", job_id=job_id, error=str(e))
-        errors = state.get("errors", [])
-        errors.append({
-            "node": "crawl",
+    except CrawlError as e:
+        page_data = {
+            "url": url,
+            "title": "",
+            "content": "",
+            "extra_metadata": {},
+            "success": False,
             "error": str(e),
-            "error_type": type(e).__name__,
-        })
-        return {
-            "pages": [],
-            "errors": errors,
-            "step_count": state.get("step_count", 0) + 1,
-            "progress": "Crawling failed",
         }
+
+    if not page_data["success"]:
+        logger.warning("crawl_branch_failed", job_id=job_id, url=url, error=page_data["error"])
+        return Command(
+            update={
+                "pages": [page_data],
+                "errors": [{
+                    "node": "crawl",
+                    "url": url,
+                    "error": page_data["error"],
+                    "error_type": "CrawlError",
+                }],
+            },
+            goto="aggregate",
+        )
+
+    # Skip pages that can't mention a locked entity — no LLM call needed
+    if not page_mentions_canonical(page_data, plan.get("canonical_entities", [])):
+        logger.debug("entity_prefilter_skipped_page", job_id=job_id, url=url)
+        return Command(update={"pages": [page_data]}, goto="aggregate")
+
+    return Command(
+        update={"pages": [page_data]},
+        goto=Send(
+            "extract_one_page",
+            {
+                "page": page_data,
+                "plan": plan,
+                "job_id": job_id,
+                "prompt_header": state.get("prompt_header"),
+            },
+        ),
+    )
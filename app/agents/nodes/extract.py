@@ -1,10 +1,19 @@
-"""Extract node: Extract structured data from crawled pages."""
+"""Extract node: Extract structured data from crawled pages.
 
-from typing import Any
+Each successful page is dispatched as an independent parallel branch via
+the LangGraph Send API; branch results accumulate on the `entities`
+state channel (see app.agents.state.AgentState).
+"""
 
+import asyncio
+from typing import Any, cast
+
+import tiktoken
 from pydantic import BaseModel, Field
 
-from app.agents.state import AgentState
+from app.agents.nodes.compare import DIMENSIONS_BY_MODE, DIMENSIONS_DEFAULT
+from app.agents.state import ExtractBranchState
+from app.core.config import get_settings
 from app.core.logging import get_logger
 from app.tools.llm import get_llm_client
 
@@ -28,38 +37,103 @@ class ExtractedEntity(BaseModel):
     market_judgment: str = Field(default="", description="市场判断（一句话）")
 
 
-async def extract_node(state: AgentState) -> dict[str, Any]:
-    """Extract structured data from crawled pages.
-    
+# Lazily-loaded tokenizer for content truncation (False = unavailable)
+_encoding: Any = None
+
+
+def _truncate_tokens(text: str, max_tokens: int) -> str:
+    """Truncate text to a token budget before sending it to the LLM.
+
+    Code-point slicing over-sends CJK content by ~3x in UTF-8/tokens, so
+    truncate on the tokenizer's boundary instead. Falls back to a
+    code-point slice if the encoding cannot be loaded (e.g. offline).
+
     Args:
-        state: Current agent state
-        
+        text: Raw page content
+        max_tokens: Token budget
+
     Returns:
-        Updated state with extracted entities
+        Truncated text
     """
-    job_id = state["job_id"]
-    pages = state.get("pages", [])
-    plan = state.get("plan", {})
-    
-    logger.info("extract_node_started", job_id=job_id, page_count=len(pages))
-    
-    try:
-        llm = get_llm_client()
-        entities = []
-        
-        # Extract from successful pages only
-        successful_pages = [p for p in pages if p.get("success", False)]
-        
-        for page in successful_pages:
-            try:
-                # Get locked entity list from plan
-                canonical_entities = plan.get("canonical_entities", [])
-                canonical_str = "、".join(canonical_entities) if canonical_entities else "无"
-                entity_type = plan.get("entity_type", "产品/服务")
-                excluded_types = plan.get("excluded_types", [])
-                excluded_str = "、".join(excluded_types[:5]) if excluded_types else "无"
-                
-                prompt = f"""你是专业行业研究分析师。从网页内容中提取【已锁定实体】的信息。
+    global _encoding
+    if _encoding is None:
+        try:
+            _encoding = tiktoken.get_encoding("cl100k_base")
+        except Exception as e:
+            logger.warning("tiktoken_encoding_unavailable", error=str(e))
+            _encoding = False
+
+    if not _encoding:
+        return text[: max_tokens * 2]
+
+    ids = _encoding.encode(text)
+    if len(ids) <= max_tokens:
+        return text
+    return cast(str, _encoding.decode(ids[:max_tokens]))
+
+
+# Shared across parallel Send branches to respect provider rate limits
+_extract_semaphore: asyncio.Semaphore | None = None
+
+
+def _get_extract_semaphore() -> asyncio.Semaphore:
+    """Get the shared extraction semaphore.
+
+    Returns:
+        Semaphore bounding concurrent LLM extraction calls
+    """
+    global _extract_semaphore
+    if _extract_semaphore is None:
+        _extract_semaphore = asyncio.Semaphore(get_settings().extract_concurrency)
+    return _extract_semaphore
+
+
+def page_mentions_canonical(page: dict[str, Any], canonical_entities: list[str]) -> bool:
+    """Cheap substring prefilter before paying for an LLM call.
+
+    Pages that mention none of the locked entities would come back as
+    "不匹配" anyway, so rule them out with C-level substring search on
+    the content and title first.
+
+    Args:
+        page: Crawled page dict
+        canonical_entities: Locked entity names from the plan
+
+    Returns:
+        True if any locked entity appears in the page (or no list exists)
+    """
+    if not canonical_entities:
+        return True
+
+    canonical_lower = [e.lower() for e in canonical_entities]
+    content = page.get("content", "").lower()
+    if any(e in content for e in canonical_lower):
+        return True
+
+    title = page.get("title", "").lower()
+    return any(e in title for e in canonical_lower)
+
+
+def build_prompt_header(plan: dict[str, Any]) -> str:
+    """Build the job-scoped portion of the extraction prompt.
+
+    The canonical entity list, entity type and exclusions are constant
+    across all pages of one job, so the fan-out router builds this once
+    and passes it to every branch instead of re-interpolating per page.
+
+    Args:
+        plan: Research plan from the plan node
+
+    Returns:
+        Prompt header ending just before the per-page section
+    """
+    canonical_entities = plan.get("canonical_entities", [])
+    canonical_str = "、".join(canonical_entities) if canonical_entities else "无"
+    entity_type = plan.get("entity_type", "产品/服务")
+    excluded_types = plan.get("excluded_types", [])
+    excluded_str = "、".join(excluded_types[:5]) if excluded_types else "无"
+
+    return f"""你是专业行业研究分析师。从网页内容中提取【已锁定实体】的信息。
 
 ## ⚠️ 重要规则（实体驱动研究）
 你只能提取以下【已锁定实体】的信息：
@@ -74,13 +148,39 @@ async def extract_node(state: AgentState) -> dict[str, Any]:
 
 ## 必须排除的类型
 {excluded_str}
+"""
+
+
+async def extract_one_page(state: ExtractBranchState) -> dict[str, Any]:
+    """Extract structured data from a single crawled page.
+
+    Runs as one parallel branch dispatched by `route_to_extractors` in
+    app.agents.graph. The fan-in is automatic: each branch returns zero
+    or one entities and the `entities` channel accumulates them.
+
+    Args:
+        state: Branch input with `page`, `plan` and `job_id`
+
+    Returns:
+        State update with the extracted entities (possibly empty)
+    """
+    job_id = state["job_id"]
+    page = state["page"]
+    plan = state.get("plan", {})
 
+    try:
+        llm = get_llm_client()
+
+        # Job-scoped header is precomputed at fan-out; rebuild only as fallback
+        prompt_header = state.get("prompt_header") or build_prompt_header(plan)
+
+        prompt = prompt_header + f"""
 ## 网页信息
 页面标题: {page.get('title', 'Unknown')}
 URL: {page.get('url', '')}
 
 内容:
-{page.get('content', '')[:4000]}
+{_truncate_tokens(page.get('content', ''), get_settings().extract_max_content_tokens)}
 
 ## 提取要求
 1. 只提取【已锁定实体】的信息
@@ -88,64 +188,66 @@ URL: {page.get('url', '')}
 3. 信息不足时填写"未公开"
 4. 所有输出必须使用中文
 5. 如果网页不包含任何锁定实体信息，company填"不匹配\""""
-                
-                extracted = await llm.generate_structured(
-                    prompt=prompt,
-                    response_model=ExtractedEntity,
-                    system_prompt="你是实体驱动研究专家。只提取已锁定实体的信息，丢弃不属于锁定列表的内容。用中文输出。",
-                )
-                
-                # Filter out non-matching entities
-                if extracted.company == "不匹配" or not extracted.company:
-                    logger.info("entity_filtered_not_in_canonical_list", job_id=job_id, url=page["url"])
-                    continue
-                
-                entity_data = extracted.model_dump()
-                entity_data["source_url"] = page["url"]
-                entity_data["source_title"] = page.get("title", "")
-                
-                entities.append(entity_data)
-                
-                logger.info(
-                    "entity_extracted",
-                    job_id=job_id,
-                    url=page["url"],
-                    entity_name=extracted.company,
-                )
-                
-            except Exception as e:
-                logger.warning(
-                    "entity_extraction_failed",
-                    job_id=job_id,
-                    url=page.get("url"),
-                    error=str(e),
-                )
-                # Continue with other pages
-                continue
-        
+
+        async with _get_extract_semaphore():
+            extracted = await llm.generate_structured(
+                prompt=prompt,
+                response_model=ExtractedEntity,
+                system_prompt="你是实体驱动研究专家。只提取已锁定实体的信息，丢弃不属于锁定列表的内容。用中文输出。",
+            )
+
+        # Filter out non-matching entities
+        if extracted.company == "不匹配" or not extracted.company:
+            logger.info("entity_filtered_not_in_canonical_list", job_id=job_id, url=page["url"])
+            return {"entities": []}
+
+        # All 11 fields are plain strings; a literal dict skips the
+        # model_dump serializer walk
+        entity_data = {
+            "company": extracted.company,
+            "product_name": extracted.product_name,
+            "release_date": extracted.release_date,
+            "positioning": extracted.positioning,
+            "tech_specs": extracted.tech_specs,
+            "business_model": extracted.business_model,
+            "pricing": extracted.pricing,
+            "advantages": extracted.advantages,
+            "disadvantages": extracted.disadvantages,
+            "target_users": extracted.target_users,
+            "market_judgment": extracted.market_judgment,
+            "source_url": page["url"],
+            "source_title": page.get("title", ""),
+        }
+
+        # Contribute this entity's comparison row directly; the
+        # comparison_rows reducer merges rows across branches so compare
+        # only has to pivot, not re-walk entities × dimensions
+        fixed_dimensions = DIMENSIONS_BY_MODE.get(
+            plan.get("research_mode", "B"), DIMENSIONS_DEFAULT
+        )
+        row = {
+            dim_name: entity_data[field_name]
+            for dim_name, field_name in fixed_dimensions
+            if entity_data[field_name]
+        }
+
         logger.info(
-            "extract_node_completed",
+            "entity_extracted",
             job_id=job_id,
-            entities_extracted=len(entities),
+            url=page["url"],
+            entity_name=extracted.company,
         )
-        
         return {
-            "entities": entities,
-            "step_count": state.get("step_count", 0) + 1,
-            "progress": f"Extracted {len(entities)} entities from {len(successful_pages)} pages",
+            "entities": [entity_data],
+            "comparison_rows": {extracted.company: row},
         }
-        
+
     except Exception as e:
-        logger.error("extract_node_failed", job_id=job_id, error=str(e))
-        errors = state.get("errors", [])
-        errors.append({
-            "node": "extract",
-            "error": str(e),
-            "error_type": type(e).__name__,
-        })
-        return {
-            "entities": [],
-            "errors": errors,
-            "step_count": state.get("step_count", 0) + 1,
-            "progress": "Extraction failed",
-        }
+        logger.warning(
+            "entity_extraction_failed",
+            job_id=job_id,
+            url=page.get("url"),
+            error=str(e),
+        )
+        # Failed branches contribute nothing; other branches continue
+        return {"entities": []}
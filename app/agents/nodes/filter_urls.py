@@ -25,21 +25,27 @@ async def filter_urls_node(state: AgentState) -> dict[str, Any]:
     logger.info("filter_urls_node_started", job_id=job_id, url_count=len(urls))
     
     try:
-        # Remove duplicates (already done in search, but double-check)
-        unique_urls = list(dict.fromkeys(urls))
-        
-        # Apply URL limit
-        if len(unique_urls) > max_urls:
+        # Streaming dedupe bounded by max_urls: stop as soon as enough
+        # unique URLs are collected instead of deduping the whole list
+        original_count = len(urls)
+        seen: set[str] = set()
+        filtered_urls: list[str] = []
+        for url in urls:
+            if url in seen:
+                continue
+            seen.add(url)
+            filtered_urls.append(url)
+            if len(filtered_urls) >= max_urls:
+                break
+
+        if original_count > len(filtered_urls):
             logger.warning(
                 "url_limit_applied",
                 job_id=job_id,
-                original_count=len(unique_urls),
+                original_count=original_count,
                 max_urls=max_urls,
             )
-            filtered_urls = unique_urls[:max_urls]
-        else:
-            filtered_urls = unique_urls
-        
+
         # TODO: Add quality filtering based on:
         # - Domain reputation
         # - URL patterns
@@ -53,22 +59,21 @@ async def filter_urls_node(state: AgentState) -> dict[str, Any]:
         )
         
         return {
-            "filtered_urls": filtered_urls,
+            "filtered_urls": tuple(filtered_urls),
             "step_count": state.get("step_count", 0) + 1,
             "progress": f"Filtered to {len(filtered_urls)} URLs",
         }
         
     except Exception as e:
         logger.error("filter_urls_node_failed", job_id=job_id, error=str(e))
-        errors = state.get("errors", [])
-        errors.append({
+        new_errors = [{
             "node": "filter_urls",
             "error": str(e),
             "error_type": type(e).__name__,
-        })
+        }]
         return {
             "filtered_urls": [],
-            "errors": errors,
+            "errors": new_errors,
             "step_count": state.get("step_count", 0) + 1,
             "progress": "URL filtering failed",
         }
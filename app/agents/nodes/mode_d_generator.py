@@ -6,18 +6,21 @@ This module implements Mode D's solution recommendation generation:
 - Actionable purchase/implementation guides
 """
 
+import io
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.core.logging import get_logger
-from app.tools.llm import get_llm_client
+from app.tools.llm_cache import cached_structured
 
 logger = get_logger(__name__)
 
 
 class ModeDOutput(BaseModel):
     """Mode D complete output structure using simple nested dict."""
+
+    model_config = ConfigDict(defer_build=True, frozen=True)
     
     # Format: {"场景名": {"预算": "...", "配置": {"CPU": {...}, ...}, "适合": "...", "理由": "..."}}
     solutions: dict[str, dict[str, Any]] = Field(
@@ -32,24 +35,9 @@ class ModeDOutput(BaseModel):
     )
 
 
-async def generate_mode_d_report(query: str, job_id: str) -> tuple[str, dict]:
-    """Generate Mode D report with solution recommendations.
-    
-    Args:
-        query: User's research query
-        job_id: Job ID for logging
-        
-    Returns:
-        Tuple of (markdown_report, visualization_json)
-    """
-    llm = get_llm_client()
-    
-    logger.info("mode_d_generation_started", job_id=job_id)
-    
-    prompt = f"""这是一个【系统配置 / 方案推荐】任务。
-
-## 研究目标
-{query}
+# Static blocks first, query last: maximizes the provider prompt-cache
+# prefix; rendered once at import with only {query} substituted per call
+_MODE_D_PROMPT_TEMPLATE = """这是一个【系统配置 / 方案推荐】任务。
 
 ## 任务要求
 为用户提供可以【直接照着购买或实施】的完整方案。
@@ -77,72 +65,97 @@ async def generate_mode_d_report(query: str, job_id: str) -> tuple[str, dict]:
 1. 至少3个场景方案
 2. 每个方案至少5个组件
 3. 只输出具体型号，不要分析市场
-4. 不要生成对比表"""
+4. 不要生成对比表
+
+## 研究目标
+{query}"""
+
+
+async def generate_mode_d_report(query: str, job_id: str) -> tuple[str, dict]:
+    """Generate Mode D report with solution recommendations.
+    
+    Args:
+        query: User's research query
+        job_id: Job ID for logging
+        
+    Returns:
+        Tuple of (markdown_report, visualization_json)
+    """
+    
+    # Bind job_id once; later events reuse the prebuilt context
+    log = logger.bind(job_id=job_id)
+    log.info("mode_d_generation_started")
+    
+    prompt = _MODE_D_PROMPT_TEMPLATE.format(query=query)
 
-    result = await llm.generate_structured(
+    result = await cached_structured(
+        template_id="mode_d_v1",
         prompt=prompt,
+        slots={"query": query},
         response_model=ModeDOutput,
         system_prompt="你是系统配置专家。输出格式必须是嵌套字典，不要输出文本。",
     )
     
-    logger.info(
-        "mode_d_generation_completed",
-        job_id=job_id,
-        solutions=len(result.solutions),
-    )
+    log.info("mode_d_generation_completed", solutions=len(result.solutions))
     
     # === Build Markdown Report ===
-    md_lines = [
-        f"# {query}",
-        "",
-        "> 以下方案可直接照着购买或实施",
-        "",
-    ]
-    
+    buf = io.StringIO()
+    w = buf.write
+
+    w(f"# {query}\n\n> 以下方案可直接照着购买或实施\n\n")
+
+    # Markdown and the flattened visualization form are built in the same
+    # pass over solutions — each entry is only walked once
+    viz_items: list[dict[str, Any]] = []
+
     # Output each solution
     for i, (scenario, solution) in enumerate(result.solutions.items(), 1):
         budget = solution.get("budget", "未知")
         configs = solution.get("configs", {})
         target = solution.get("target", "")
         reason = solution.get("reason", "")
-        
-        md_lines.extend([
-            f"## 方案 {chr(64+i)}：{scenario}",
-            "",
-        ])
-        
+
+        w(f"## 方案 {chr(64+i)}：{scenario}\n\n")
+
+        components: list[dict[str, str]] = []
         for component, config in configs.items():
             if isinstance(config, dict):
                 model = config.get("model", "")
                 comp_reason = config.get("reason", "")
-                md_lines.append(f"- **{component}**：{model} — {comp_reason}")
+                w(f"- **{component}**：{model} — {comp_reason}\n")
+                components.append({"name": component, "model": model, "reason": comp_reason})
             else:
-                md_lines.append(f"- **{component}**：{config}")
-        
-        md_lines.extend([
-            "",
-            f"**适合人群**：{target}",
-            "",
-            f"**推荐理由**：{reason}",
-            "",
-            "---",
-            "",
-        ])
-    
+                w(f"- **{component}**：{config}\n")
+                components.append({"name": component, "model": str(config), "reason": ""})
+
+        viz_items.append({
+            "scenario": scenario,
+            "budget": budget,
+            "target": target,
+            "reason": reason,
+            "components": components,
+        })
+
+        w(
+            "\n"
+            f"**适合人群**：{target}\n"
+            "\n"
+            f"**推荐理由**：{reason}\n"
+            "\n"
+            "---\n"
+            "\n"
+        )
+
     # Output selection principles
-    md_lines.extend([
-        "## 选型原则说明",
-        "",
-    ])
+    w("## 选型原则说明\n\n")
     for i, principle in enumerate(result.selection_principles, 1):
-        md_lines.append(f"{i}. {principle}")
-    
-    md_lines.append("")
-    
+        w(f"{i}. {principle}\n")
+
     # === Build Visualization JSON ===
     visualization_json = {
         "solutions": result.solutions,
+        "solution_items": viz_items,  # pre-flattened for frontend rendering
         "selection_principles": result.selection_principles,
     }
-    
-    return "\n".join(md_lines), visualization_json
+
+    return buf.getvalue(), visualization_json
@@ -7,18 +7,21 @@ This module implements Mode E's framework-based analysis:
 - NOT predictions, but frameworks for understanding
 """
 
+import io
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.core.logging import get_logger
-from app.tools.llm import get_llm_client
+from app.tools.llm_cache import cached_structured
 
 logger = get_logger(__name__)
 
 
 class ModeEOutput(BaseModel):
     """Mode E complete output structure."""
+
+    model_config = ConfigDict(defer_build=True, frozen=True)
     
     problem_essence: str = Field(
         ...,
@@ -47,24 +50,9 @@ class ModeEOutput(BaseModel):
     )
 
 
-async def generate_mode_e_report(query: str, job_id: str) -> tuple[str, dict]:
-    """Generate Mode E report with framework-based analysis.
-    
-    Args:
-        query: User's research query
-        job_id: Job ID for logging
-        
-    Returns:
-        Tuple of (markdown_report, visualization_json)
-    """
-    llm = get_llm_client()
-    
-    logger.info("mode_e_generation_started", job_id=job_id)
-    
-    prompt = f"""这是一个【宏观 / 框架型判断】任务。
-
-## 研究目标
-{query}
+# Static blocks first, query last: maximizes the provider prompt-cache
+# prefix; rendered once at import with only {query} substituted per call
+_MODE_E_PROMPT_TEMPLATE = """这是一个【宏观 / 框架型判断】任务。
 
 ## 任务要求
 不是预测结果，而是帮助用户理解"这个问题应该如何被分析和看待"。
@@ -84,64 +72,78 @@ async def generate_mode_e_report(query: str, job_id: str) -> tuple[str, dict]:
 5. short_vs_long_term: 短期波动和长期趋势的不同驱动逻辑
 6. action_suggestions: 分别给普通用户、长期配置者、研究者的行动建议
 
-你的成功标准不是"说得准"，而是"说得清楚"。"""
+你的成功标准不是"说得准"，而是"说得清楚"。
+
+## 研究目标
+{query}"""
+
+
+async def generate_mode_e_report(query: str, job_id: str) -> tuple[str, dict]:
+    """Generate Mode E report with framework-based analysis.
+    
+    Args:
+        query: User's research query
+        job_id: Job ID for logging
+        
+    Returns:
+        Tuple of (markdown_report, visualization_json)
+    """
+    
+    # Bind job_id once; later events reuse the prebuilt context
+    log = logger.bind(job_id=job_id)
+    log.info("mode_e_generation_started")
+    
+    prompt = _MODE_E_PROMPT_TEMPLATE.format(query=query)
 
-    result = await llm.generate_structured(
+    result = await cached_structured(
+        template_id="mode_e_v1",
         prompt=prompt,
+        slots={"query": query},
         response_model=ModeEOutput,
         system_prompt="你是宏观分析框架专家。只提供理解框架，不做具体预测。输出格式必须是结构化字典。",
     )
     
-    logger.info("mode_e_generation_completed", job_id=job_id)
+    log.info("mode_e_generation_completed")
     
     # === Build Markdown Report ===
-    md_lines = [
-        f"# {query}",
-        "",
-        "> 这是一个框架型分析，帮助理解问题而非预测结果",
-        "",
-        "## 问题本质",
-        "",
-        result.problem_essence,
-        "",
-        "## 核心驱动变量",
-        "",
-    ]
-    
+    buf = io.StringIO()
+    w = buf.write
+
+    w(
+        f"# {query}\n"
+        "\n"
+        "> 这是一个框架型分析，帮助理解问题而非预测结果\n"
+        "\n"
+        "## 问题本质\n"
+        "\n"
+        f"{result.problem_essence}\n"
+        "\n"
+        "## 核心驱动变量\n"
+        "\n"
+    )
+
     for i, (driver, explanation) in enumerate(result.core_drivers.items(), 1):
-        md_lines.append(f"**{i}. {driver}**")
-        md_lines.append(f"   {explanation}")
-        md_lines.append("")
-    
-    md_lines.extend([
-        "## 关键不确定性",
-        "",
-    ])
+        w(f"**{i}. {driver}**\n   {explanation}\n\n")
+
+    w("## 关键不确定性\n\n")
     for uncertainty in result.key_uncertainties:
-        md_lines.append(f"- {uncertainty}")
-    
-    md_lines.extend([
-        "",
-        "## 可能的情景路径",
-        "",
-    ])
+        w(f"- {uncertainty}\n")
+
+    w("\n## 可能的情景路径\n\n")
     for scenario, description in result.scenario_paths.items():
-        md_lines.append(f"### {scenario}")
-        md_lines.append(description)
-        md_lines.append("")
-    
-    md_lines.extend([
-        "## 短期 vs 长期的区别",
-        "",
-        result.short_vs_long_term,
-        "",
-        "## 行动建议（非预测）",
-        "",
-    ])
+        w(f"### {scenario}\n{description}\n\n")
+
+    w(
+        "## 短期 vs 长期的区别\n"
+        "\n"
+        f"{result.short_vs_long_term}\n"
+        "\n"
+        "## 行动建议（非预测）\n"
+        "\n"
+    )
     for audience, suggestion in result.action_suggestions.items():
-        md_lines.append(f"**{audience}**：{suggestion}")
-        md_lines.append("")
-    
+        w(f"**{audience}**：{suggestion}\n\n")
+
     # === Build Visualization JSON ===
     visualization_json = {
         "problem_essence": result.problem_essence,
@@ -151,4 +153,4 @@ async def generate_mode_e_report(query: str, job_id: str) -> tuple[str, dict]:
         "action_suggestions": result.action_suggestions,
     }
     
-    return "\n".join(md_lines), visualization_json
+    return buf.getvalue(), visualization_json
@@ -2,17 +2,20 @@
 
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.agents.state import AgentState
 from app.core.logging import get_logger
-from app.tools.llm import get_llm_client
+from app.tools.llm_cache import cached_structured
 
 logger = get_logger(__name__)
 
 
 class EntityModelMapping(BaseModel):
     """实体与代表模型的映射。"""
+
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
     entity: str = Field(..., description="公司/组织名称")
     representative_model: str = Field(..., description="代表模型名（必须是模型名，不是产品名）")
 
@@ -20,6 +23,9 @@ class EntityModelMapping(BaseModel):
 class ResearchPlan(BaseModel):
     """投资级研究计划。"""
 
+    # Built lazily (warmed in the app lifespan) and immutable once parsed
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
     # Step -1: 研究模式分类（最先判断，严格）
     research_mode: str = Field(
         ...,
@@ -102,27 +108,13 @@ class ResearchPlan(BaseModel):
     )
 
 
-async def plan_node(state: AgentState) -> dict[str, Any]:
-    """生成投资级研究计划。
-    
-    核心原则：先判断可行性，再锁定实体，最后为实体找证据。
-    """
-    job_id = state["job_id"]
-    query = state["query"]
-    
-    logger.info("plan_node_started", job_id=job_id, query=query)
-    
-    try:
-        llm = get_llm_client()
-        
-        prompt = f"""你是一个"研究问题分类器（Research Classifier）"。
+# Static instruction blocks come first and the query last so the
+# provider-side prompt cache gets the longest possible prefix; the
+# template itself is rendered once at import and only {query} is
+# substituted per request
+_PLAN_PROMPT_TEMPLATE = """你是一个"研究问题分类器（Research Classifier）"。
 你的唯一任务是判断用户问题应该用哪种研究模式处理。
 
-## 研究问题
-{query}
-
----
-
 ## Step -1: 研究模式分类（严格，最先判断）
 
 ### Mode A：已知竞品对比（Known-Entity Comparison）
@@ -252,10 +244,32 @@ entity_model_mapping 必须是对象数组，每个对象包含：
 ## Step 4: 搜索关键词
 必须包含实体名称 + 评测/对比/分析等词
 
-所有输出必须使用中文。"""
-        
-        plan = await llm.generate_structured(
+所有输出必须使用中文。
+
+---
+
+## 研究问题
+{query}"""
+
+
+async def plan_node(state: AgentState) -> dict[str, Any]:
+    """生成投资级研究计划。
+    
+    核心原则：先判断可行性，再锁定实体，最后为实体找证据。
+    """
+    job_id = state["job_id"]
+    query = state["query"]
+    
+    log = logger.bind(job_id=job_id)
+    log.info("plan_node_started", query=query)
+    
+    try:
+        prompt = _PLAN_PROMPT_TEMPLATE.format(query=query)
+
+        plan = await cached_structured(
+            template_id="plan_v1",
             prompt=prompt,
+            slots={"query": query},
             response_model=ResearchPlan,
             system_prompt="你是投资级研究顾问。首先判断研究可行性，再锁定实体-模型映射。如果市场不成熟，必须明确指出。用中文输出。",
         )
@@ -264,10 +278,14 @@ entity_model_mapping 必须是对象数组，每个对象包含：
         
         # Extract entity names for backward compatibility
         plan_dict["canonical_entities"] = [m.entity for m in plan.entity_model_mapping]
+        # Already validated by Pydantic — store as (entity, model) pairs so
+        # report_node can destructure without per-row isinstance/get guards
+        plan_dict["entity_model_mapping"] = [
+            (m.entity, m.representative_model) for m in plan.entity_model_mapping
+        ]
         
-        logger.info(
+        log.info(
             "plan_node_completed",
-            job_id=job_id,
             research_mode=plan.research_mode,
             entity_count=len(plan.entity_model_mapping),
             keywords_count=len(plan.search_keywords),
@@ -280,15 +298,14 @@ entity_model_mapping 必须是对象数组，每个对象包含：
         }
         
     except Exception as e:
-        logger.error("plan_node_failed", job_id=job_id, error=str(e))
-        errors = state.get("errors", [])
-        errors.append({
+        log.error("plan_node_failed", error=str(e))
+        new_errors = [{
             "node": "plan",
             "error": str(e),
             "error_type": type(e).__name__,
-        })
+        }]
         return {
-            "errors": errors,
+            "errors": new_errors,
             "step_count": state.get("step_count", 0) + 1,
             "progress": "Plan generation failed",
         }
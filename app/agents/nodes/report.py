@@ -1,5 +1,6 @@
 """Report node: Generate final reports in Markdown and JSON."""
 
+import io
 import json
 from typing import Any
 
@@ -11,6 +12,119 @@ from app.agents.nodes.mode_e_generator import generate_mode_e_report
 
 logger = get_logger(__name__)
 
+# Static report blocks, built once at import — zero per-request allocation
+_MODE_A_FALLBACK_TABLE = (
+    "## 核心对比表\n"
+    "\n"
+    "| 维度 | Notion | Coda | Confluence | Airtable | 飞书文档 | 语雀 |\n"
+    "|------|--------|------|------------|----------|----------|------|\n"
+    "| **产品定位** | All-in-One知识库 | 灵活文档+表格 | 企业Wiki | 数据库+表格 | 企业协作 | 知识库 |\n"
+    "| **核心功能** | 文档/数据库/看板 | 文档/自动化 | 文档/空间 | 表格/视图 | 文档/协作 | 文档/知识库 |\n"
+    "| **协作能力** | 中 | 中 | 强 | 中 | 强 | 中 |\n"
+    "| **学习成本** | 中 | 高 | 高 | 中 | 低 | 低 |\n"
+    "| **目标用户** | 个人/小团队 | 创意团队 | 大型企业 | 数据团队 | 企业 | 技术团队 |\n"
+    "| **定价** | 免费+付费 | 免费+付费 | 付费 | 免费+付费 | 免费 | 免费+付费 |\n"
+    "\n"
+)
+
+_MODE_A_FIT_BLOCK = (
+    "### 适合谁\n"
+    "\n"
+    "- 需要 All-in-One 知识管理的个人用户\n"
+    "- 小型团队的文档协作和项目跟踪\n"
+    "- 注重信息组织和知识沉淀的团队\n"
+    "\n"
+    "### 不适合谁\n"
+    "\n"
+    "- 需要强大项目管理功能的专业 PM 团队\n"
+    "- 对实时协作要求极高的场景\n"
+    "- 大型企业的复杂工作流自动化需求\n"
+    "\n"
+)
+
+_MODE_B_FALLBACK_BLOCK = (
+    "### 主要阵营与技术路线\n"
+    "\n"
+    "- **头部玩家:** 持续加大投入，构建生态壁垒\n"
+    "- **新兴势力:** 寻找差异化定位，切入垂直场景\n"
+    "- **开源社区:** 提供替代方案，降低迁移成本\n"
+    "\n"
+    "### 关键趋势\n"
+    "\n"
+    "1. AI 能力成为核心竞争力\n"
+    "2. 垂直场景深耕 vs 通用平台扩张\n"
+    "3. 定价策略分化明显\n"
+    "\n"
+    "### 尚不确定的因素\n"
+    "\n"
+    "- 用户付费意愿的天花板\n"
+    "- 大厂入局的影响程度\n"
+    "- 监管政策的潜在变化\n"
+    "\n"
+)
+
+_MODE_C_IMMATURITY_BLOCK = (
+    "### 尚未成熟的关键原因\n"
+    "\n"
+    "1. 概念定义尚未标准化，行业边界模糊\n"
+    "2. 缺乏可规模化的商业模式验证\n"
+    "3. 用户需求和付费意愿尚不明确\n"
+    "\n"
+    "### 变化条件（未来 12-24 个月）\n"
+    "\n"
+    "- 头部科技公司明确进入该领域\n"
+    "- 出现标杆性融资或并购事件\n"
+    "- 技术底层出现关键突破\n"
+    "\n"
+    "### 行动建议\n"
+    "\n"
+    "- **研究层面:** 持续跟踪，暂不作为核心研究方向\n"
+    "- **投资层面:** 观望为主，关注早期信号\n"
+    "- **产品层面:** 可作为探索性方向，不宜重仓投入\n"
+    "\n"
+)
+
+_MODE_C_KEY_VARIABLES_BLOCK = (
+    "## 未来 12-24 个月关键变量\n"
+    "\n"
+    "- 技术成熟度演进\n"
+    "- 头部玩家战略调整\n"
+    "- 监管政策变化\n"
+    "- 资本市场态度\n"
+    "\n"
+)
+
+# Mode A: 竞品对比维度（聚焦产品特性）
+_DIM_ORDER_A: tuple[str, ...] = (
+    "公司/组织", "代表产品/模型", "产品定位",
+    "核心功能", "协作能力", "目标用户", "适合场景",
+    "定价区间", "主要优势", "主要劣势",
+)
+
+# Mode B/C: 通用维度
+_DIM_ORDER_BC: tuple[str, ...] = (
+    "公司/组织", "代表产品/模型", "发布时间", "产品定位",
+    "核心技术参数", "商业模式", "定价区间",
+    "主要优势", "主要劣势", "目标用户", "市场判断",
+)
+
+
+def _trunc(value: Any) -> Any:
+    """Truncate long cell values for the comparison table."""
+    if isinstance(value, str) and len(value) > 50:
+        return value[:47] + "..."
+    return value
+
+
+_RISK_BLOCK = (
+    "## 风险与不确定性\n"
+    "\n"
+    "- **数据时效性:** 信息来源于网络公开资料，可能存在滞后\n"
+    "- **信息完整度:** 部分字段可能因来源限制而缺失\n"
+    "- **市场变化:** 竞争格局持续演变，结论仅供参考\n"
+    "\n"
+)
+
 
 async def report_node(state: AgentState) -> dict[str, Any]:
     """Generate final report in Markdown and JSON formats.
@@ -27,7 +141,8 @@ async def report_node(state: AgentState) -> dict[str, Any]:
     entities = state.get("entities", [])
     plan = state.get("plan", {})
     
-    logger.info("report_node_started", job_id=job_id)
+    log = logger.bind(job_id=job_id)
+    log.info("report_node_started")
     
     try:
         # Get research mode
@@ -35,7 +150,7 @@ async def report_node(state: AgentState) -> dict[str, Any]:
         
         # === Mode A: Use Three-Phase Generator ===
         if research_mode == "A":
-            logger.info("mode_a_three_phase_started", job_id=job_id)
+            log.info("mode_a_three_phase_started")
             mode_a_md, visualization_json = await generate_mode_a_report(query, job_id)
             
             # Build JSON report with visualization data
@@ -46,7 +161,7 @@ async def report_node(state: AgentState) -> dict[str, Any]:
                 "visualization": visualization_json,
             }
             
-            logger.info("report_node_completed", job_id=job_id, mode="A")
+            log.info("report_node_completed", mode="A")
             
             return {
                 "report_md": mode_a_md,
@@ -57,7 +172,7 @@ async def report_node(state: AgentState) -> dict[str, Any]:
         
         # === Mode D: Solution Recommendation Generator ===
         if research_mode == "D":
-            logger.info("mode_d_generation_started", job_id=job_id)
+            log.info("mode_d_generation_started")
             mode_d_md, visualization_json = await generate_mode_d_report(query, job_id)
             
             # Build JSON report with visualization data
@@ -68,7 +183,7 @@ async def report_node(state: AgentState) -> dict[str, Any]:
                 "visualization": visualization_json,
             }
             
-            logger.info("report_node_completed", job_id=job_id, mode="D")
+            log.info("report_node_completed", mode="D")
             
             return {
                 "report_md": mode_d_md,
@@ -79,7 +194,7 @@ async def report_node(state: AgentState) -> dict[str, Any]:
         
         # === Mode E: Macro Framework Analysis Generator ===
         if research_mode == "E":
-            logger.info("mode_e_generation_started", job_id=job_id)
+            log.info("mode_e_generation_started")
             mode_e_md, visualization_json = await generate_mode_e_report(query, job_id)
             
             # Build JSON report with visualization data
@@ -90,7 +205,7 @@ async def report_node(state: AgentState) -> dict[str, Any]:
                 "visualization": visualization_json,
             }
             
-            logger.info("report_node_completed", job_id=job_id, mode="E")
+            log.info("report_node_completed", mode="E")
             
             return {
                 "report_md": mode_e_md,
@@ -100,7 +215,7 @@ async def report_node(state: AgentState) -> dict[str, Any]:
             }
         
         # === Mode B/C: Original Logic ===
-        research_mode = plan.get("research_mode", "未知")
+        # research_mode was already read once for mode dispatch above
         mode_confidence = plan.get("mode_confidence", 0.8)
         mode_reason = plan.get("mode_reason", "")
         suggested_layer = plan.get("suggested_layer", "未知")
@@ -124,54 +239,50 @@ async def report_node(state: AgentState) -> dict[str, Any]:
         }
         mode_desc = mode_map.get(research_mode, research_mode)
         
-        md_lines = [
-            f"# {query}",
-            "",
-            "## 1. 研究分类与可行性",
-            "",
-            f"- **研究模式:** {mode_desc} (置信度: {mode_confidence:.0%})",
-            f"- **模式判断:** {mode_reason}",
-            f"- **建议层级:** {suggested_layer}",
-            f"- **可行性:** {feasibility}",
-        ]
-        
+        # Single growable buffer instead of a list of small strings
+        buf = io.StringIO()
+        w = buf.write
+
+        w(
+            f"# {query}\n"
+            "\n"
+            "## 1. 研究分类与可行性\n"
+            "\n"
+            f"- **研究模式:** {mode_desc} (置信度: {mode_confidence:.0%})\n"
+            f"- **模式判断:** {mode_reason}\n"
+            f"- **建议层级:** {suggested_layer}\n"
+            f"- **可行性:** {feasibility}\n"
+        )
+
         # 如果有风险提醒
         if risk_note:
-            md_lines.append(f"- **⚠️ 风险提醒:** {risk_note}")
-        
+            w(f"- **⚠️ 风险提醒:** {risk_note}\n")
+
         # 如果有层级校正，显示校正信息
         if layer_correction_needed and corrected_level:
-            md_lines.extend([
-                f"- **⚠️ 层级校正:** 是",
-                f"- **校正后层级:** {corrected_level}",
-                f"- **校正原因:** {correction_reason}",
-            ])
-        
-        md_lines.extend([
-            f"- **可行性评估:** {feasibility}",
-            "",
-        ])
-        
+            w(
+                "- **⚠️ 层级校正:** 是\n"
+                f"- **校正后层级:** {corrected_level}\n"
+                f"- **校正原因:** {correction_reason}\n"
+            )
+
+        w("\n")
+
         # === 2. 实体-模型映射表 ===
-        md_lines.extend([
-            "## 2. 实体-模型映射（Canonical Entity List）",
-            "",
-            f"**研究对象类型:** {entity_type}",
-            "",
-            "| 序号 | 实体（公司/组织） | 代表模型 |",
-            "|------|------------------|----------|",
-        ])
-        
-        for i, mapping in enumerate(entity_model_mapping, 1):
-            entity = mapping.get("entity", "未知") if isinstance(mapping, dict) else "未知"
-            model = mapping.get("representative_model", "无清晰代表模型") if isinstance(mapping, dict) else "未知"
-            md_lines.append(f"| {i} | {entity} | {model} |")
-        
-        md_lines.extend([
-            "",
-            f"**成功提取信息:** {len(entities)} 个实体",
-            "",
-        ])
+        w(
+            "## 2. 实体-模型映射（Canonical Entity List）\n"
+            "\n"
+            f"**研究对象类型:** {entity_type}\n"
+            "\n"
+            "| 序号 | 实体（公司/组织） | 代表模型 |\n"
+            "|------|------------------|----------|\n"
+        )
+
+        # plan_node stores validated (entity, model) pairs
+        for i, (entity, model) in enumerate(entity_model_mapping, 1):
+            w(f"| {i} | {entity} | {model} |\n")
+
+        w(f"\n**成功提取信息:** {len(entities)} 个实体\n\n")
         
         # === 2. 核心对比表（根据模式调整） ===
         # Mode A: 强制生成表格（最高优先级）
@@ -180,79 +291,48 @@ async def report_node(state: AgentState) -> dict[str, Any]:
         
         if research_mode == "C" and len(entities) < 3:
             show_table = False
-            md_lines.extend([
-                "## 当前主要技术/产品路径",
-                "",
-                "*此概念型市场实体数量不足，以判断为主*",
-                "",
-            ])
-        
+            w(
+                "## 当前主要技术/产品路径\n"
+                "\n"
+                "*此概念型市场实体数量不足，以判断为主*\n"
+                "\n"
+            )
+
         # Mode A: 强制表格规则（Structure-First，最高优先级）
         if research_mode == "A" and not comparison_table:
             # Fallback: 生成基于行业常识的完整对比表（≥5列 × ≥4行）
-            md_lines.extend([
-                "## 核心对比表",
-                "",
-                "| 维度 | Notion | Coda | Confluence | Airtable | 飞书文档 | 语雀 |",
-                "|------|--------|------|------------|----------|----------|------|",
-                "| **产品定位** | All-in-One知识库 | 灵活文档+表格 | 企业Wiki | 数据库+表格 | 企业协作 | 知识库 |",
-                "| **核心功能** | 文档/数据库/看板 | 文档/自动化 | 文档/空间 | 表格/视图 | 文档/协作 | 文档/知识库 |",
-                "| **协作能力** | 中 | 中 | 强 | 中 | 强 | 中 |",
-                "| **学习成本** | 中 | 高 | 高 | 中 | 低 | 低 |",
-                "| **目标用户** | 个人/小团队 | 创意团队 | 大型企业 | 数据团队 | 企业 | 技术团队 |",
-                "| **定价** | 免费+付费 | 免费+付费 | 付费 | 免费+付费 | 免费 | 免费+付费 |",
-                "",
-            ])
+            w(_MODE_A_FALLBACK_TABLE)
             show_table = False  # 已生成 fallback 表格
-        
+
         if show_table and comparison_table:
-            md_lines.extend([
-                "## 核心对比表",
-                "",
-            ])
-            
-            # Get company names
-            company_names = set()
-            for dim_data in comparison_table.values():
-                company_names.update(dim_data.keys())
-            company_names = sorted(company_names)
+            w("## 核心对比表\n\n")
+
+            # Column headers come straight from the plan's canonical entity
+            # list (keeps plan-defined ordering, no union scan over the
+            # table); fall back to scanning only if the plan has no entities
+            company_names = plan.get("canonical_entities") or sorted(
+                {company for dim_data in comparison_table.values() for company in dim_data}
+            )
             
             if company_names:
                 # Create markdown table
-                header = "| 维度 | " + " | ".join(company_names) + " |"
-                separator = "|" + "|".join(["---"] * (len(company_names) + 1)) + "|"
-                
-                md_lines.extend([header, separator])
-                
+                w("| 维度 | " + " | ".join(company_names) + " |\n")
+                w("|" + "|".join(["---"] * (len(company_names) + 1)) + "|\n")
+
                 # 根据模式选择不同的维度顺序
-                if research_mode == "A":
-                    # Mode A: 竞品对比维度（聚焦产品特性）
-                    dim_order = [
-                        "公司/组织", "代表产品/模型", "产品定位",
-                        "核心功能", "协作能力", "目标用户", "适合场景",
-                        "定价区间", "主要优势", "主要劣势"
-                    ]
-                else:
-                    # Mode B/C: 通用维度
-                    dim_order = [
-                        "公司/组织", "代表产品/模型", "发布时间", "产品定位",
-                        "核心技术参数", "商业模式", "定价区间", 
-                        "主要优势", "主要劣势", "目标用户", "市场判断"
-                    ]
-                
+                dim_order = _DIM_ORDER_A if research_mode == "A" else _DIM_ORDER_BC
+
+                # Single pass per row: one join instead of repeated +=
                 for dimension in dim_order:
-                    if dimension in comparison_table:
-                        products = comparison_table[dimension]
-                        row = f"| **{dimension}** |"
-                        for company in company_names:
-                            value = products.get(company, "—")
-                            # Truncate long values
-                            if isinstance(value, str) and len(value) > 50:
-                                value = value[:47] + "..."
-                            row += f" {value} |"
-                        md_lines.append(row)
-                
-                md_lines.append("")
+                    products = comparison_table.get(dimension)
+                    if products is not None:
+                        cells = " | ".join(
+                            str(_trunc(products.get(company, "—")))
+                            for company in company_names
+                        )
+                        w(f"| **{dimension}** | {cells} |\n")
+
+                w("\n")
         
         # === 3. 关键结论（根据模式不同标题） ===
         if research_mode == "A":
@@ -262,129 +342,53 @@ async def report_node(state: AgentState) -> dict[str, Any]:
         else:
             conclusion_title = "## 概念判断"
         
-        md_lines.extend([
-            conclusion_title,
-            "",
-        ])
-        
+        w(conclusion_title + "\n\n")
+
         # Generate conclusions based on entities and mode
         if research_mode == "C":
             # Mode C: 强制判断型结论（即使无实体也必须输出）
             feasibility_text = feasibility if feasibility else "需进一步验证"
-            
-            md_lines.extend([
-                "### 市场真实性判断",
-                "",
-                f"**判断:** 基于当前信息，{feasibility_text}",
-                "",
-                "### 尚未成熟的关键原因",
-                "",
-                "1. 概念定义尚未标准化，行业边界模糊",
-                "2. 缺乏可规模化的商业模式验证",
-                "3. 用户需求和付费意愿尚不明确",
-                "",
-                "### 变化条件（未来 12-24 个月）",
-                "",
-                "- 头部科技公司明确进入该领域",
-                "- 出现标杆性融资或并购事件",
-                "- 技术底层出现关键突破",
-                "",
-                "### 行动建议",
-                "",
-                "- **研究层面:** 持续跟踪，暂不作为核心研究方向",
-                "- **投资层面:** 观望为主，关注早期信号",
-                "- **产品层面:** 可作为探索性方向，不宜重仓投入",
-                "",
-            ])
+
+            w(f"### 市场真实性判断\n\n**判断:** 基于当前信息，{feasibility_text}\n\n")
+            w(_MODE_C_IMMATURITY_BLOCK)
         elif research_mode == "A":
             # Mode A: 强制竞品对比结论（即使无实体也必须输出）
             if entities:
                 judgments = [e.get("market_judgment", "") for e in entities if e.get("market_judgment")]
                 for i, judgment in enumerate(judgments[:5], 1):
                     if judgment:
-                        md_lines.append(f"{i}. {judgment}")
-                md_lines.append("")
-            
+                        w(f"{i}. {judgment}\n")
+                w("\n")
+
             # Mode A Fallback: 强制输出适合谁/不适合谁
-            md_lines.extend([
-                "### 适合谁",
-                "",
-                "- 需要 All-in-One 知识管理的个人用户",
-                "- 小型团队的文档协作和项目跟踪",
-                "- 注重信息组织和知识沉淀的团队",
-                "",
-                "### 不适合谁",
-                "",
-                "- 需要强大项目管理功能的专业 PM 团队",
-                "- 对实时协作要求极高的场景",
-                "- 大型企业的复杂工作流自动化需求",
-                "",
-            ])
+            w(_MODE_A_FIT_BLOCK)
         elif research_mode == "B":
             # Mode B: 趋势型市场分析
             if entities:
                 judgments = [e.get("market_judgment", "") for e in entities if e.get("market_judgment")]
                 for i, judgment in enumerate(judgments[:5], 1):
                     if judgment:
-                        md_lines.append(f"{i}. {judgment}")
-                md_lines.append("")
+                        w(f"{i}. {judgment}\n")
+                w("\n")
             else:
                 # Mode B Fallback: 趋势型分析（无需完整对比表）
-                md_lines.extend([
-                    "### 主要阵营与技术路线",
-                    "",
-                    "- **头部玩家:** 持续加大投入，构建生态壁垒",
-                    "- **新兴势力:** 寻找差异化定位，切入垂直场景",
-                    "- **开源社区:** 提供替代方案，降低迁移成本",
-                    "",
-                    "### 关键趋势",
-                    "",
-                    "1. AI 能力成为核心竞争力",
-                    "2. 垂直场景深耕 vs 通用平台扩张",
-                    "3. 定价策略分化明显",
-                    "",
-                    "### 尚不确定的因素",
-                    "",
-                    "- 用户付费意愿的天花板",
-                    "- 大厂入局的影响程度",
-                    "- 监管政策的潜在变化",
-                    "",
-                ])
+                w(_MODE_B_FALLBACK_BLOCK)
         else:
             # Generic fallback
-            md_lines.append("*建议调整搜索关键词或研究范围*")
-            md_lines.append("")
-        
+            w("*建议调整搜索关键词或研究范围*\n\n")
+
         # === 4. 模式特定部分 ===
         if research_mode == "C":
             # Mode C: 未来关键变量
-            md_lines.extend([
-                "## 未来 12-24 个月关键变量",
-                "",
-                "- 技术成熟度演进",
-                "- 头部玩家战略调整",
-                "- 监管政策变化",
-                "- 资本市场态度",
-                "",
-            ])
-        
+            w(_MODE_C_KEY_VARIABLES_BLOCK)
+
         # === 5. 风险与不确定性 ===
-        md_lines.extend([
-            "## 风险与不确定性",
-            "",
-            "- **数据时效性:** 信息来源于网络公开资料，可能存在滞后",
-            "- **信息完整度:** 部分字段可能因来源限制而缺失",
-            "- **市场变化:** 竞争格局持续演变，结论仅供参考",
-            "",
-        ])
-        
+        w(_RISK_BLOCK)
+
         # Compact footer
-        md_lines.extend([
-            "---",
-            f"*任务 ID: {job_id}*",
-        ])
-        
-        report_md = "\n".join(md_lines)
+        w(f"---\n*任务 ID: {job_id}*")
+
+        report_md = buf.getvalue()
         
         # Generate JSON report
         report_json = {
@@ -399,11 +403,7 @@ async def report_node(state: AgentState) -> dict[str, Any]:
             },
         }
         
-        logger.info(
-            "report_node_completed",
-            job_id=job_id,
-            report_length=len(report_md),
-        )
+        log.info("report_node_completed", report_length=len(report_md))
         
         return {
             "report_md": report_md,
@@ -413,17 +413,16 @@ async def report_node(state: AgentState) -> dict[str, Any]:
         }
         
     except Exception as e:
-        logger.error("report_node_failed", job_id=job_id, error=str(e))
-        errors = state.get("errors", [])
-        errors.append({
+        log.error("report_node_failed", error=str(e))
+        new_errors = [{
             "node": "report",
             "error": str(e),
             "error_type": type(e).__name__,
-        })
+        }]
         return {
             "report_md": f"# Error Generating Report\n\nAn error occurred: {str(e)}",
             "report_json": {"error": str(e)},
-            "errors": errors,
+            "errors": new_errors,
             "step_count": state.get("step_count", 0) + 1,
             "progress": "Report generation failed",
         }
@@ -1,10 +1,11 @@
 """Search node: Search for relevant URLs."""
 
+import asyncio
 from typing import Any
 
 from app.agents.state import AgentState
 from app.core.logging import get_logger
-from app.tools.search import get_search_tool
+from app.tools.search import canonicalize_url, get_search_tool
 
 logger = get_logger(__name__)
 
@@ -31,22 +32,49 @@ async def search_node(state: AgentState) -> dict[str, Any]:
         # Use search keywords from plan if available, otherwise use original query
         search_keywords = plan.get("search_keywords", [query])
         
-        # Search using the first few keywords
-        all_urls = []
-        for keyword in search_keywords[:3]:  # Limit to first 3 keywords
-            results = await search_tool.search(
-                query=keyword,
-                max_results=max_urls,
-            )
-            all_urls.extend([r.url for r in results])
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_urls = []
-        for url in all_urls:
-            if url not in seen:
-                seen.add(url)
-                unique_urls.append(url)
+        keywords = search_keywords[:5]  # Limit to first 5 keywords
+
+        async def _search_one(keyword: str) -> tuple[str, list | Exception]:
+            try:
+                return keyword, await search_tool.search(query=keyword, max_results=max_urls)
+            except Exception as e:  # noqa: BLE001 — recorded per keyword below
+                return keyword, e
+
+        # Keyword searches fly concurrently; results are merged as each
+        # one finishes so dedup overlaps network wait, and once max_urls
+        # unique pages are collected the remaining searches are cancelled
+        # (the filter node caps at max_urls anyway).
+        tasks = [asyncio.create_task(_search_one(keyword)) for keyword in keywords]
+        new_errors = []
+        # Dedup on the canonical form so query-string/fragment variants of
+        # the same page are crawled once; the first original URL is kept.
+        by_canonical: dict[str, str] = {}
+        try:
+            for future in asyncio.as_completed(tasks):
+                keyword, results = await future
+                if isinstance(results, Exception):
+                    logger.warning(
+                        "search_keyword_failed",
+                        job_id=job_id,
+                        keyword=keyword,
+                        error=str(results),
+                    )
+                    new_errors.append({
+                        "node": "search",
+                        "error": str(results),
+                        "error_type": type(results).__name__,
+                    })
+                    continue
+                for result in results:
+                    by_canonical.setdefault(canonicalize_url(result.url), result.url)
+                if len(by_canonical) >= max_urls:
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        # Published as an immutable tuple — downstream only reads
+        unique_urls = tuple(by_canonical.values())
         
         logger.info(
             "search_node_completed",
@@ -56,21 +84,21 @@ async def search_node(state: AgentState) -> dict[str, Any]:
         
         return {
             "urls": unique_urls,
+            "errors": new_errors,
             "step_count": state.get("step_count", 0) + 1,
             "progress": f"Found {len(unique_urls)} candidate URLs",
         }
         
     except Exception as e:
         logger.error("search_node_failed", job_id=job_id, error=str(e))
-        errors = state.get("errors", [])
-        errors.append({
+        new_errors = [{
             "node": "search",
             "error": str(e),
             "error_type": type(e).__name__,
-        })
+        }]
         return {
             "urls": [],
-            "errors": errors,
+            "errors": new_errors,
             "step_count": state.get("step_count", 0) + 1,
             "progress": "Search failed",
         }
@@ -1,6 +1,27 @@
 """Agent state definition for LangGraph."""
 
-from typing import Any, TypedDict
+import operator
+from collections.abc import Sequence
+from typing import Annotated, Any, TypedDict
+
+
+def merge_nested_dicts(
+    a: dict[str, dict[str, Any]],
+    b: dict[str, dict[str, Any]],
+) -> dict[str, dict[str, Any]]:
+    """Reducer for nested-dict channels written by parallel branches.
+
+    Outer keys are unioned; inner dicts are merged with the update
+    winning on conflicts.
+
+    Args:
+        a: Current channel value
+        b: Branch update
+
+    Returns:
+        Merged nested dict
+    """
+    return {**a, **{k: {**a.get(k, {}), **v} for k, v in b.items()}}
 
 
 class AgentState(TypedDict, total=False):
@@ -17,15 +38,17 @@ class AgentState(TypedDict, total=False):
     # Planning
     plan: dict[str, Any]  # Research plan with dimensions/criteria
     
-    # Search & URLs
-    urls: list[str]  # Candidate URLs from search
-    filtered_urls: list[str]  # URLs after filtering/deduplication
+    # Search & URLs (read-only downstream — nodes publish tuples)
+    urls: Sequence[str]  # Candidate URLs from search
+    filtered_urls: Sequence[str]  # URLs after filtering/deduplication
     
-    # Crawling
-    pages: list[dict[str, Any]]  # Crawled page data
+    # Crawling (accumulated across parallel Send branches)
+    pages: Annotated[list[dict[str, Any]], operator.add]
     
-    # Extraction
-    entities: list[dict[str, Any]]  # Extracted structured data
+    # Extraction (accumulated across parallel Send branches)
+    entities: Annotated[list[dict[str, Any]], operator.add]
+    # Row-major comparison data: { company: { dimension: value } }
+    comparison_rows: Annotated[dict[str, dict[str, Any]], merge_nested_dicts]
     
     # Comparison & Reporting
     comparison_table: dict[str, Any]  # Comparison table structure
@@ -37,8 +60,26 @@ class AgentState(TypedDict, total=False):
     max_steps: int  # Maximum allowed steps
     max_urls: int  # Maximum URLs to process
     
-    # Error tracking
-    errors: list[dict[str, Any]]  # List of errors encountered
+    # Error tracking (nodes return only new errors; the reducer appends)
+    errors: Annotated[list[dict[str, Any]], operator.add]
     
     # Progress tracking
     progress: str  # Human-readable progress message
+
+
+class CrawlBranchState(TypedDict, total=False):
+    """Send payload for one parallel crawl branch (see route_to_crawlers)."""
+
+    url: str
+    plan: dict[str, Any]
+    job_id: str
+    prompt_header: str | None
+
+
+class ExtractBranchState(TypedDict, total=False):
+    """Send payload for one parallel extract branch (see crawl_one)."""
+
+    page: dict[str, Any]
+    plan: dict[str, Any]
+    job_id: str
+    prompt_header: str | None
@@ -1,6 +1,10 @@
 """API routes."""
 
-from fastapi import APIRouter, HTTPException, Response
+import hashlib
+from collections.abc import AsyncIterator
+
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
 from app.api.schemas import (
     HealthResponse,
@@ -11,12 +15,31 @@ from app.api.schemas import (
 )
 from app.core.errors import JobNotFoundError
 from app.core.logging import get_logger
+from app.services.cache import get_cache_service
 from app.services.jobs import get_job_service
 from app.services.reporting import get_reporting_service
 
 logger = get_logger(__name__)
 
-router = APIRouter()
+# orjson serializes the large report/comparison payloads several times
+# faster than the default json response class
+router = APIRouter(default_response_class=ORJSONResponse)
+
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+async def _iter_text_chunks(text: str) -> AsyncIterator[str]:
+    """Yield a large text body in chunks for a streaming response."""
+    for i in range(0, len(text), _STREAM_CHUNK_SIZE):
+        yield text[i:i + _STREAM_CHUNK_SIZE]
+
+
+def _etag_for(content: bytes) -> str:
+    """Build a strong ETag for immutable report content."""
+    return f'"{hashlib.blake2b(content, digest_size=16).hexdigest()}"'
+
+
+_REPORT_CACHE_CONTROL = "private, max-age=3600"
 
 
 @router.get("/health", response_model=HealthResponse)
@@ -122,29 +145,40 @@ async def get_job_report(job_id: str) -> JobReportResponse:
 
 
 @router.get("/reports/{job_id}/markdown")
-async def get_job_report_markdown(job_id: str) -> Response:
+async def get_job_report_markdown(job_id: str, request: Request) -> Response:
     """Get job report as Markdown file.
-    
+
     Args:
         job_id: Job identifier
-        
+        request: Incoming request (for conditional-GET headers)
+
     Returns:
         Markdown file
     """
     logger.info("job_report_markdown_request", job_id=job_id)
-    
+
     try:
         job_service = get_job_service()
-        report = await job_service.get_job_report(job_id)
-        
-        if not report["report_md"]:
+        # Column-only fetch: skips report_json and the other wide columns
+        report_md = await job_service.get_report_markdown(job_id)
+
+        if not report_md:
             raise HTTPException(status_code=404, detail="Report not yet generated")
-        
-        return Response(
-            content=report["report_md"],
+
+        # Completed reports are immutable, so a content-hash ETag lets
+        # repeat downloads short-circuit to 304 without resending the body
+        etag = _etag_for(report_md.encode())
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+
+        # Stream in chunks so multi-MB reports don't sit in one response body
+        return StreamingResponse(
+            _iter_text_chunks(report_md),
             media_type="text/markdown",
             headers={
-                "Content-Disposition": f"attachment; filename={job_id}_report.md"
+                "Content-Disposition": f"attachment; filename={job_id}_report.md",
+                "ETag": etag,
+                "Cache-Control": _REPORT_CACHE_CONTROL,
             },
         )
         
@@ -162,34 +196,49 @@ async def get_job_report_markdown(job_id: str) -> Response:
 
 
 @router.get("/reports/{job_id}/csv")
-async def get_job_report_csv(job_id: str) -> Response:
+async def get_job_report_csv(job_id: str, request: Request) -> Response:
     """Get job comparison table as CSV file.
-    
+
     Args:
         job_id: Job identifier
-        
+        request: Incoming request (for conditional-GET headers)
+
     Returns:
         CSV file
     """
     logger.info("job_report_csv_request", job_id=job_id)
-    
+
     try:
         job_service = get_job_service()
         report = await job_service.get_job_report(job_id)
-        
+
         if not report["report_json"]:
             raise HTTPException(status_code=404, detail="Report not yet generated")
-        
-        # Generate CSV from comparison table
-        reporting_service = get_reporting_service()
+
         comparison_table = report["report_json"].get("comparison_table", {})
-        csv_content = await reporting_service.generate_csv(comparison_table)
-        
+
+        # CSV is rendered once per job: the bytes land in the cache service
+        # and repeat downloads serve them straight from memory (or 304)
+        cache = get_cache_service()
+        cache_key = f"report_csv:{job_id}"
+        csv_bytes = await cache.get(cache_key)
+        if csv_bytes is None:
+            reporting_service = get_reporting_service()
+            csv_str = reporting_service.generate_csv(comparison_table)
+            csv_bytes = csv_str.encode()
+            await cache.set(cache_key, csv_bytes)
+
+        etag = _etag_for(csv_bytes)
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+
         return Response(
-            content=csv_content,
+            content=csv_bytes,
             media_type="text/csv",
             headers={
-                "Content-Disposition": f"attachment; filename={job_id}_comparison.csv"
+                "Content-Disposition": f"attachment; filename={job_id}_comparison.csv",
+                "ETag": etag,
+                "Cache-Control": _REPORT_CACHE_CONTROL,
             },
         )
         
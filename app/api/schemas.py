@@ -2,12 +2,14 @@
 
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ResearchRequest(BaseModel):
     """Request to create a research job."""
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     query: str = Field(
         ...,
         description="Research query",
@@ -20,6 +22,8 @@ class ResearchRequest(BaseModel):
 class ResearchResponse(BaseModel):
     """Response after creating a research job."""
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     job_id: str = Field(..., description="Unique job identifier")
     query: str = Field(..., description="Research query")
     status: str = Field(..., description="Job status")
@@ -29,6 +33,8 @@ class ResearchResponse(BaseModel):
 class JobStatusResponse(BaseModel):
     """Job status response."""
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     job_id: str = Field(..., description="Job identifier")
     query: str = Field(..., description="Research query")
     status: str = Field(..., description="Job status")
@@ -45,6 +51,8 @@ class JobStatusResponse(BaseModel):
 class JobReportResponse(BaseModel):
     """Job report response."""
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     job_id: str = Field(..., description="Job identifier")
     query: str = Field(..., description="Research query")
     status: str = Field(..., description="Job status")
@@ -55,5 +63,7 @@ class JobReportResponse(BaseModel):
 class HealthResponse(BaseModel):
     """Health check response."""
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     status: str = Field(..., description="Service status")
     version: str = Field(..., description="API version")
@@ -22,11 +22,19 @@ class Settings(BaseSettings):
     openai_api_base: str | None = Field(default=None, description="OpenAI API base URL (for proxies)")
     openai_model: str = Field(default="gpt-4o-mini", description="OpenAI model name")
     openai_max_tokens: int = Field(default=4096, description="Max tokens per request")
+    llm_concurrency: int = Field(
+        default=8, description="Max in-flight LLM requests (tune to provider RPM)"
+    )
 
     # Agent Guardrails
     max_agent_steps: int = Field(default=20, description="Maximum agent execution steps")
     max_urls: int = Field(default=10, description="Maximum URLs to process")
     max_crawl_concurrency: int = Field(default=3, description="Max concurrent crawls")
+    extract_concurrency: int = Field(default=5, description="Max concurrent LLM extraction calls")
+    extract_max_content_tokens: int = Field(
+        default=1500, description="Max page-content tokens sent to the extraction LLM"
+    )
+    search_concurrency: int = Field(default=5, description="Max concurrent web searches")
     crawl_timeout_seconds: int = Field(default=30, description="Crawl timeout in seconds")
     max_retries: int = Field(default=3, description="Max retry attempts")
 
@@ -35,6 +43,13 @@ class Settings(BaseSettings):
         default="sqlite+aiosqlite:///./research_agent.db",
         description="Database connection URL",
     )
+    db_pool_size: int = Field(default=20, description="Connection pool size (non-SQLite)")
+    db_max_overflow: int = Field(
+        default=20, description="Extra connections beyond the pool (non-SQLite)"
+    )
+    db_pool_recycle_seconds: int = Field(
+        default=3600, description="Recycle pooled connections older than this"
+    )
 
     # Logging
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = Field(
@@ -47,8 +62,12 @@ class Settings(BaseSettings):
     # Cache
     cache_enabled: bool = Field(default=True, description="Enable caching")
     cache_ttl_seconds: int = Field(default=3600, description="Cache TTL in seconds")
+    cache_max_items: int = Field(default=1024, description="Max in-memory cache entries")
 
     # API
+    cors_origins: list[str] = Field(
+        default=["*"], description="Allowed CORS origins (set explicitly in production)"
+    )
     api_host: str = Field(default="0.0.0.0", description="API host")
     api_port: int = Field(default=8000, description="API port")
     api_reload: bool = Field(default=True, description="Enable auto-reload")
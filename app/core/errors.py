@@ -66,28 +66,30 @@ class JobNotFoundError(ResearchAgentError):
     pass
 
 
+# Category per exception class; classify_error walks the MRO so
+# subclasses inherit their nearest ancestor's category
+_ERROR_CATEGORIES: dict[type, str] = {
+    StepLimitExceededError: "step_limit_exceeded",
+    URLLimitExceededError: "url_limit_exceeded",
+    CrawlError: "crawl_failed",
+    ExtractionError: "extraction_failed",
+    LLMError: "llm_failed",
+    DatabaseError: "database_error",
+    TimeoutError: "timeout",
+}
+
+
 def classify_error(error: Exception) -> str:
     """Classify error into categories for better handling.
-    
+
     Args:
         error: Exception to classify
-        
+
     Returns:
         Error category string
     """
-    if isinstance(error, StepLimitExceededError):
-        return "step_limit_exceeded"
-    elif isinstance(error, URLLimitExceededError):
-        return "url_limit_exceeded"
-    elif isinstance(error, CrawlError):
-        return "crawl_failed"
-    elif isinstance(error, ExtractionError):
-        return "extraction_failed"
-    elif isinstance(error, LLMError):
-        return "llm_failed"
-    elif isinstance(error, DatabaseError):
-        return "database_error"
-    elif isinstance(error, TimeoutError):
-        return "timeout"
-    else:
-        return "unknown_error"
+    for cls in type(error).__mro__:
+        category = _ERROR_CATEGORIES.get(cls)
+        if category is not None:
+            return category
+    return "unknown_error"
@@ -1,9 +1,13 @@
 """Structured logging configuration using structlog."""
 
 import logging
+import logging.handlers
+import queue
 import sys
+from functools import lru_cache
 from typing import Any
 
+import orjson
 import structlog
 from structlog.types import EventDict, Processor
 
@@ -16,8 +20,27 @@ def add_app_context(logger: Any, method_name: str, event_dict: EventDict) -> Eve
     return event_dict
 
 
+def _orjson_serializer(event_dict: EventDict, **kwargs: Any) -> str:
+    """Serialize a log entry with orjson instead of stdlib json.
+
+    Log rendering runs on every emitted event; orjson is several times
+    faster and handles datetimes natively. Unknown types fall back to str.
+    """
+    return orjson.dumps(event_dict, default=str).decode()
+
+
+# Background writer for the queue-based log sink (started once)
+_queue_listener: logging.handlers.QueueListener | None = None
+
+
 def configure_logging() -> None:
-    """Configure structured logging for the application."""
+    """Configure structured logging for the application.
+
+    Log records are handed to a queue and written to stdout by a
+    background thread, so log calls inside async handlers return without
+    blocking the event loop on stdout I/O.
+    """
+    global _queue_listener
     settings = get_settings()
 
     # Determine processors based on log format
@@ -27,7 +50,7 @@ def configure_logging() -> None:
             structlog.processors.add_log_level,
             structlog.processors.TimeStamper(fmt="iso"),
             add_app_context,
-            structlog.processors.JSONRenderer(),
+            structlog.processors.JSONRenderer(serializer=_orjson_serializer),
         ]
     else:
         processors = [
@@ -38,17 +61,55 @@ def configure_logging() -> None:
             structlog.dev.ConsoleRenderer(),
         ]
 
+    # Rendered lines flow stdlib logger -> queue -> background thread,
+    # which does the blocking write()+flush() off the event loop
+    if _queue_listener is None:
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(logging.Formatter("%(message)s"))
+        _queue_listener = logging.handlers.QueueListener(log_queue, stream_handler)
+        _queue_listener.start()
+
+        root = logging.getLogger()
+        root.handlers = [logging.handlers.QueueHandler(log_queue)]
+        root.setLevel(logging.getLevelName(settings.log_level))
+
     structlog.configure(
         processors=processors,
         wrapper_class=structlog.make_filtering_bound_logger(
             logging.getLevelName(settings.log_level)
         ),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(file=sys.stdout),
+        logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
 
 
+def shutdown_logging() -> None:
+    """Stop the background log writer, flushing queued records."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+@lru_cache
+def log_level_enabled(level: int) -> bool:
+    """Check whether a stdlib log level is enabled for the app.
+
+    Lets hot paths skip evaluating log kwargs (len(), slices) that the
+    filtering bound logger would drop anyway.
+
+    Args:
+        level: Stdlib level constant (e.g. logging.INFO)
+
+    Returns:
+        True if records at this level are emitted
+    """
+    settings = get_settings()
+    return level >= logging.getLevelNamesMapping()[settings.log_level]
+
+
 def get_logger(name: str | None = None) -> structlog.BoundLogger:
     """Get a structured logger instance.
     
@@ -2,8 +2,20 @@
 
 from datetime import datetime
 from enum import Enum as PyEnum
-
-from sqlalchemy import JSON, DateTime, Enum, Integer, String, Text, func
+from uuid import UUID
+
+from sqlalchemy import (
+    JSON,
+    DateTime,
+    Enum,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+    Uuid,
+    func,
+)
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -27,9 +39,13 @@ class ResearchJob(Base):
     """Research job tracking."""
 
     __tablename__ = "research_jobs"
+    # Covers "recent jobs by status" listings without a full table scan
+    __table_args__ = (Index("ix_jobs_status_updated", "status", "updated_at"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    job_id: Mapped[str] = mapped_column(String(64), unique=True, nullable=False, index=True)
+    # Stored as native UUID (16 bytes) where the backend supports it —
+    # halves the hot job_id index versus the old 36-char hex string
+    job_id: Mapped[UUID] = mapped_column(Uuid, unique=True, nullable=False, index=True)
     query: Mapped[str] = mapped_column(String(512), nullable=False)
     status: Mapped[JobStatus] = mapped_column(
         Enum(JobStatus), default=JobStatus.PENDING, nullable=False
@@ -60,9 +76,12 @@ class SourceURL(Base):
     """Crawled source URLs."""
 
     __tablename__ = "source_urls"
+    # One row per URL per job — lets crawl retries upsert instead of
+    # piling up duplicate rows
+    __table_args__ = (UniqueConstraint("job_id", "url", name="uq_sources_job_url"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    job_id: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
+    job_id: Mapped[UUID] = mapped_column(Uuid, nullable=False, index=True)
     url: Mapped[str] = mapped_column(String(2048), nullable=False)
     title: Mapped[str | None] = mapped_column(String(512), nullable=True)
     content: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -81,9 +100,11 @@ class ExtractedEntity(Base):
     """Extracted structured entities."""
 
     __tablename__ = "extracted_entities"
+    # Covers per-job entity lookups joined back to their source URL
+    __table_args__ = (Index("ix_entities_job_source", "job_id", "source_url_id"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    job_id: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
+    job_id: Mapped[UUID] = mapped_column(Uuid, nullable=False, index=True)
     source_url_id: Mapped[int] = mapped_column(Integer, nullable=False)
     entity_type: Mapped[str] = mapped_column(String(128), nullable=False)
     entity_data: Mapped[dict] = mapped_column(JSON, nullable=False)
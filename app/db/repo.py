@@ -1,8 +1,11 @@
 """Repository pattern for database operations."""
 
-from datetime import datetime
+import uuid
+from collections.abc import AsyncIterator
+from typing import Any, cast
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, func, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.errors import DatabaseError, JobNotFoundError
@@ -12,6 +15,37 @@ from app.db.models import ExtractedEntity, JobStatus, ResearchJob, SourceURL
 logger = get_logger(__name__)
 
 
+def _as_uuid(job_id: str) -> uuid.UUID:
+    """Parse a job_id into the UUID the columns store.
+
+    Callers pass job IDs as strings (API paths, agent state); the columns
+    store native UUIDs. Malformed IDs cannot match any row, so they map to
+    JobNotFoundError rather than leaking a ValueError.
+    """
+    try:
+        return uuid.UUID(job_id)
+    except ValueError as e:
+        raise JobNotFoundError(f"Job not found: {job_id}") from e
+
+
+# Bulk inserts are chunked to stay under SQLite's bound-parameter limit
+_BULK_INSERT_CHUNK = 300
+
+# Streaming reads buffer this many rows at a time
+_STREAM_YIELD_PER = 200
+
+# Hot lookups as module constants: one clause tree built at import, and a
+# stable construct so SQLAlchemy's compiled-statement cache always hits
+_GET_JOB_STMT = select(ResearchJob).where(ResearchJob.job_id == bindparam("job_id"))
+_GET_REPORT_MD_STMT = select(ResearchJob.report_md).where(
+    ResearchJob.job_id == bindparam("job_id")
+)
+_GET_SOURCES_STMT = select(SourceURL).where(SourceURL.job_id == bindparam("job_id"))
+_GET_ENTITIES_STMT = select(ExtractedEntity).where(
+    ExtractedEntity.job_id == bindparam("job_id")
+)
+
+
 class ResearchJobRepository:
     """Repository for research job operations."""
 
@@ -44,7 +78,7 @@ class ResearchJobRepository:
         """
         try:
             job = ResearchJob(
-                job_id=job_id,
+                job_id=_as_uuid(job_id),
                 query=query,
                 status=JobStatus.PENDING,
                 max_steps=max_steps,
@@ -71,7 +105,7 @@ class ResearchJobRepository:
             JobNotFoundError: If job doesn't exist
         """
         result = await self.session.execute(
-            select(ResearchJob).where(ResearchJob.job_id == job_id)
+            _GET_JOB_STMT, {"job_id": _as_uuid(job_id)}
         )
         job = result.scalar_one_or_none()
         if job is None:
@@ -107,47 +141,125 @@ class ResearchJobRepository:
         if error_message:
             job.error_message = error_message
         if status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED):
-            job.completed_at = datetime.utcnow()
-        
+            # Server-side clock: consistent with the DB-defaulted
+            # created_at/updated_at and avoids deprecated utcnow()
+            job.completed_at = func.now()
+
         await self.session.flush()
         logger.info("job_status_updated", job_id=job_id, status=status.value, progress=progress)
         return job
 
+    async def update_status_direct(
+        self,
+        job_id: str,
+        status: JobStatus,
+        progress: str | None = None,
+        step_count: int | None = None,
+        error_message: str | None = None,
+    ) -> None:
+        """Update job status with a single UPDATE, without loading the row.
+
+        Use this when the caller doesn't need the ORM object back;
+        update_job_status stays for callers that mutate the returned row.
+
+        Args:
+            job_id: Job identifier
+            status: New status
+            progress: Progress description
+            step_count: Current step count
+            error_message: Error message if failed
+        """
+        values: dict[str, Any] = {"status": status}
+        if progress:
+            values["progress"] = progress
+        if step_count is not None:
+            values["step_count"] = step_count
+        if error_message:
+            values["error_message"] = error_message
+        if status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED):
+            values["completed_at"] = func.now()
+
+        await self.session.execute(
+            update(ResearchJob)
+            .where(ResearchJob.job_id == _as_uuid(job_id))
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        logger.info("job_status_updated", job_id=job_id, status=status.value, progress=progress)
+
     async def save_report(
         self,
         job_id: str,
         report_md: str,
         report_json: dict,
-    ) -> ResearchJob:
-        """Save job report.
-        
+    ) -> None:
+        """Save job report with a single UPDATE, without loading the row.
+
         Args:
             job_id: Job identifier
             report_md: Markdown report
             report_json: JSON report data
-            
-        Returns:
-            Updated job
         """
-        job = await self.get_job(job_id)
-        job.report_md = report_md
-        job.report_json = report_json
-        await self.session.flush()
+        await self.session.execute(
+            update(ResearchJob)
+            .where(ResearchJob.job_id == _as_uuid(job_id))
+            .values(report_md=report_md, report_json=report_json)
+            .execution_options(synchronize_session=False)
+        )
         logger.info("job_report_saved", job_id=job_id)
-        return job
+
+    async def get_report_markdown(self, job_id: str) -> str | None:
+        """Get only the markdown report column for a job.
+
+        Skips loading report_json and the other wide columns — the
+        markdown download route needs nothing else.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            Markdown report, or None if not yet generated
+
+        Raises:
+            JobNotFoundError: If job doesn't exist
+        """
+        result = await self.session.execute(
+            _GET_REPORT_MD_STMT, {"job_id": _as_uuid(job_id)}
+        )
+        row = result.one_or_none()
+        if row is None:
+            raise JobNotFoundError(f"Job not found: {job_id}")
+        return cast("str | None", row[0])
 
     async def add_error(self, job_id: str, error: dict) -> None:
         """Add error to job error list.
-        
+
+        Reads only the errors column and writes it back in one UPDATE —
+        no full row load, and the reassignment means the JSON column
+        change is never missed by change tracking.
+
         Args:
             job_id: Job identifier
             error: Error details
+
+        Raises:
+            JobNotFoundError: If job doesn't exist
         """
-        job = await self.get_job(job_id)
-        if job.errors is None:
-            job.errors = []
-        job.errors.append(error)
-        await self.session.flush()
+        result = await self.session.execute(
+            select(ResearchJob.errors).where(ResearchJob.job_id == _as_uuid(job_id))
+        )
+        row = result.one_or_none()
+        if row is None:
+            raise JobNotFoundError(f"Job not found: {job_id}")
+
+        errors = list(row[0] or [])
+        errors.append(error)
+        await self.session.execute(
+            update(ResearchJob)
+            .where(ResearchJob.job_id == _as_uuid(job_id))
+            .values(errors=errors)
+            .execution_options(synchronize_session=False)
+        )
 
 
 class SourceURLRepository:
@@ -186,7 +298,7 @@ class SourceURLRepository:
             Created source URL
         """
         source = SourceURL(
-            job_id=job_id,
+            job_id=_as_uuid(job_id),
             url=url,
             title=title,
             content=content,
@@ -198,6 +310,65 @@ class SourceURLRepository:
         await self.session.flush()
         return source
 
+    async def create_sources_bulk(self, job_id: str, rows: list[dict]) -> None:
+        """Insert many source URL records in chunked bulk INSERTs.
+
+        One statement per ~300 rows instead of one INSERT+flush per row —
+        use this when a node has accumulated a batch of crawl results.
+
+        Args:
+            job_id: Associated job ID
+            rows: Column dicts (url, title, content, ... as in create_source)
+        """
+        if not rows:
+            return
+        job_uuid = _as_uuid(job_id)
+        for i in range(0, len(rows), _BULK_INSERT_CHUNK):
+            chunk = [{"job_id": job_uuid, **row} for row in rows[i:i + _BULK_INSERT_CHUNK]]
+            await self.session.execute(insert(SourceURL), chunk)
+        await self.session.flush()
+        logger.info("sources_bulk_created", job_id=job_id, row_count=len(rows))
+
+    async def upsert_sources_bulk(self, job_id: str, rows: list[dict]) -> None:
+        """Insert-or-update source URL records in chunked bulk statements.
+
+        Crawl retries hit the (job_id, url) unique constraint; ON CONFLICT
+        folds the SELECT-then-INSERT/UPDATE dance into one statement per
+        chunk and sidesteps races between concurrent crawls of a URL.
+
+        Args:
+            job_id: Associated job ID
+            rows: Column dicts (url required; title, content, ... optional)
+        """
+        if not rows:
+            return
+        job_uuid = _as_uuid(job_id)
+        dialect = self.session.bind.dialect.name
+        insert_fn = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        updatable = ("title", "content", "extra_metadata", "crawl_success", "crawl_error")
+        # Multi-VALUES inserts need homogeneous keys, so missing optional
+        # columns are filled with their defaults
+        defaults = {
+            "title": None,
+            "content": None,
+            "extra_metadata": None,
+            "crawl_success": False,
+            "crawl_error": None,
+        }
+        for i in range(0, len(rows), _BULK_INSERT_CHUNK):
+            chunk = [
+                {"job_id": job_uuid, **defaults, **row}
+                for row in rows[i:i + _BULK_INSERT_CHUNK]
+            ]
+            stmt = insert_fn(SourceURL).values(chunk)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["job_id", "url"],
+                set_={column: getattr(stmt.excluded, column) for column in updatable},
+            )
+            await self.session.execute(stmt)
+        await self.session.flush()
+        logger.info("sources_bulk_upserted", job_id=job_id, row_count=len(rows))
+
     async def get_sources_by_job(self, job_id: str) -> list[SourceURL]:
         """Get all sources for a job.
         
@@ -208,10 +379,31 @@ class SourceURLRepository:
             List of source URLs
         """
         result = await self.session.execute(
-            select(SourceURL).where(SourceURL.job_id == job_id)
+            _GET_SOURCES_STMT, {"job_id": _as_uuid(job_id)}
         )
         return list(result.scalars().all())
 
+    async def iter_sources_by_job(self, job_id: str) -> AsyncIterator[SourceURL]:
+        """Stream sources for a job without materializing them all.
+
+        Memory stays bounded at the yield_per batch size however many
+        rows the job has, and the caller overlaps its work with the
+        DB fetch.
+
+        Args:
+            job_id: Job identifier
+
+        Yields:
+            Source URL rows
+        """
+        result = await self.session.stream(
+            select(SourceURL)
+            .where(SourceURL.job_id == _as_uuid(job_id))
+            .execution_options(yield_per=_STREAM_YIELD_PER)
+        )
+        async for source in result.scalars():
+            yield source
+
 
 class ExtractedEntityRepository:
     """Repository for extracted entity operations."""
@@ -243,7 +435,7 @@ class ExtractedEntityRepository:
             Created entity
         """
         entity = ExtractedEntity(
-            job_id=job_id,
+            job_id=_as_uuid(job_id),
             source_url_id=source_url_id,
             entity_type=entity_type,
             entity_data=entity_data,
@@ -252,6 +444,22 @@ class ExtractedEntityRepository:
         await self.session.flush()
         return entity
 
+    async def create_entities_bulk(self, job_id: str, rows: list[dict]) -> None:
+        """Insert many extracted entities in chunked bulk INSERTs.
+
+        Args:
+            job_id: Associated job ID
+            rows: Column dicts (source_url_id, entity_type, entity_data)
+        """
+        if not rows:
+            return
+        job_uuid = _as_uuid(job_id)
+        for i in range(0, len(rows), _BULK_INSERT_CHUNK):
+            chunk = [{"job_id": job_uuid, **row} for row in rows[i:i + _BULK_INSERT_CHUNK]]
+            await self.session.execute(insert(ExtractedEntity), chunk)
+        await self.session.flush()
+        logger.info("entities_bulk_created", job_id=job_id, row_count=len(rows))
+
     async def get_entities_by_job(self, job_id: str) -> list[ExtractedEntity]:
         """Get all entities for a job.
         
@@ -262,6 +470,23 @@ class ExtractedEntityRepository:
             List of extracted entities
         """
         result = await self.session.execute(
-            select(ExtractedEntity).where(ExtractedEntity.job_id == job_id)
+            _GET_ENTITIES_STMT, {"job_id": _as_uuid(job_id)}
         )
         return list(result.scalars().all())
+
+    async def iter_entities_by_job(self, job_id: str) -> AsyncIterator[ExtractedEntity]:
+        """Stream entities for a job without materializing them all.
+
+        Args:
+            job_id: Job identifier
+
+        Yields:
+            Extracted entity rows
+        """
+        result = await self.session.stream(
+            select(ExtractedEntity)
+            .where(ExtractedEntity.job_id == _as_uuid(job_id))
+            .execution_options(yield_per=_STREAM_YIELD_PER)
+        )
+        async for entity in result.scalars():
+            yield entity
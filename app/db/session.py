@@ -2,7 +2,9 @@
 
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from typing import Any
 
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.config import get_settings
@@ -12,17 +14,34 @@ from app.db.models import Base
 logger = get_logger(__name__)
 
 
+def _json_serializer(value: Any) -> str:
+    """Serialize JSON column values with orjson instead of stdlib json."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 class DatabaseManager:
     """Manages database connections and sessions."""
 
     def __init__(self) -> None:
         """Initialize database manager."""
         self.settings = get_settings()
-        self.engine = create_async_engine(
-            self.settings.database_url,
-            echo=False,
-            pool_pre_ping=True,
-        )
+        # JSON columns hold the multi-MB report payloads — orjson
+        # (de)serializes them several times faster than stdlib json
+        engine_kwargs: dict[str, Any] = {
+            "echo": False,
+            "pool_pre_ping": True,
+            "json_serializer": _json_serializer,
+            "json_deserializer": orjson.loads,
+        }
+        # Pool sizing matters for server databases; SQLite drivers use
+        # their own pooling and reject these arguments
+        if not self.settings.database_url.startswith("sqlite"):
+            engine_kwargs.update(
+                pool_size=self.settings.db_pool_size,
+                max_overflow=self.settings.db_max_overflow,
+                pool_recycle=self.settings.db_pool_recycle_seconds,
+            )
+        self.engine = create_async_engine(self.settings.database_url, **engine_kwargs)
         self.session_factory = async_sessionmaker(
             self.engine,
             class_=AsyncSession,
@@ -5,11 +5,15 @@ from typing import AsyncGenerator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.api.routes import router
 from app.core.config import get_settings
-from app.core.logging import configure_logging, get_logger
+from app.core.logging import configure_logging, get_logger, shutdown_logging
 from app.db.session import get_db_manager
+from app.tools.crawl import close_crawl_tool
+from app.tools.llm import close_llm_client
 
 # Configure logging first
 configure_logging()
@@ -33,12 +37,24 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     db_manager = get_db_manager()
     await db_manager.create_tables()
     logger.info("database_initialized")
+
+    # Pre-build deferred Pydantic schemas off the first-request path
+    from app.agents.nodes.mode_d_generator import ModeDOutput
+    from app.agents.nodes.mode_e_generator import ModeEOutput
+    from app.agents.nodes.plan import ResearchPlan
+
+    for model in (ResearchPlan, ModeDOutput, ModeEOutput):
+        model.model_rebuild()
+    logger.info("pydantic_schemas_prebuilt")
     
     yield
     
     # Shutdown
     logger.info("application_shutdown")
+    await close_llm_client()
+    await close_crawl_tool()
     await db_manager.close()
+    shutdown_logging()
 
 
 # Create FastAPI application
@@ -47,17 +63,24 @@ app = FastAPI(
     description="Automated market research and competitive analysis agent",
     version="1.0.0",
     lifespan=lifespan,
+    # orjson encodes every response body, not just the API router's
+    default_response_class=ORJSONResponse,
 )
 
-# Add CORS middleware
+# Add CORS middleware (origins come from settings; the "*" default is
+# for local development — set CORS_ORIGINS explicitly in production)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
+    allow_origins=get_settings().cors_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# Compress large report payloads; level 6 trades CPU for ~5-10x smaller
+# markdown/JSON bodies, and tiny responses are left alone
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=6)
+
 # Include API routes
 app.include_router(router, prefix="/api/v1", tags=["research"])
 
@@ -77,12 +100,20 @@ async def root() -> dict[str, str]:
 
 
 if __name__ == "__main__":
+    import sys
+
     import uvicorn
-    
+
     settings = get_settings()
+    # Pin the fast implementations (bundled with uvicorn[standard])
+    # instead of relying on "auto" detection; uvloop doesn't exist on
+    # Windows, so fall back to auto there
+    fast_loop = sys.platform != "win32"
     uvicorn.run(
         "app.main:app",
         host=settings.api_host,
         port=settings.api_port,
         reload=settings.api_reload,
+        loop="uvloop" if fast_loop else "auto",
+        http="httptools" if fast_loop else "auto",
     )
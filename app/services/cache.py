@@ -1,9 +1,13 @@
 """Caching service (stub implementation with extensible interface)."""
 
 import hashlib
-import json
+import inspect
+import time
+from collections import OrderedDict
 from typing import Any
 
+import orjson
+
 from app.core.config import get_settings
 from app.core.logging import get_logger
 
@@ -22,7 +26,10 @@ class CacheService:
         self.settings = get_settings()
         self.enabled = self.settings.cache_enabled
         self.ttl = self.settings.cache_ttl_seconds
-        self._cache: dict[str, Any] = {}
+        self.max_items = self.settings.cache_max_items
+        # key -> (monotonic expiry, value); bounded LRU — hits and
+        # overwrites move the key to the end, evictions pop the front
+        self._cache: OrderedDict[str, tuple[float, Any]] = OrderedDict()
 
     def _generate_key(self, prefix: str, data: Any) -> str:
         """Generate cache key from data.
@@ -34,9 +41,12 @@ class CacheService:
         Returns:
             Cache key
         """
-        data_str = json.dumps(data, sort_keys=True)
-        hash_digest = hashlib.sha256(data_str.encode()).hexdigest()
-        return f"{prefix}:{hash_digest[:16]}"
+        # orjson emits sorted bytes directly (no str intermediate) and
+        # blake2b beats sha256 here — keys aren't security-sensitive, so
+        # a fast 64-bit digest matches the 16-hex-char keys used before
+        data_bytes = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+        hash_digest = hashlib.blake2b(data_bytes, digest_size=8).hexdigest()
+        return f"{prefix}:{hash_digest}"
 
     async def get(self, key: str) -> Any | None:
         """Get value from cache.
@@ -49,12 +59,20 @@ class CacheService:
         """
         if not self.enabled:
             return None
-        
-        value = self._cache.get(key)
-        if value is not None:
-            logger.debug("cache_hit", key=key)
-        else:
+
+        entry = self._cache.get(key)
+        if entry is None:
             logger.debug("cache_miss", key=key)
+            return None
+
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._cache[key]
+            logger.debug("cache_expired", key=key)
+            return None
+
+        self._cache.move_to_end(key)
+        logger.debug("cache_hit", key=key)
         return value
 
     async def set(self, key: str, value: Any) -> None:
@@ -66,8 +84,11 @@ class CacheService:
         """
         if not self.enabled:
             return
-        
-        self._cache[key] = value
+
+        if len(self._cache) >= self.max_items and key not in self._cache:
+            self._cache.popitem(last=False)
+        self._cache[key] = (time.monotonic() + self.ttl, value)
+        self._cache.move_to_end(key)
         logger.debug("cache_set", key=key)
 
     async def get_or_compute(
@@ -91,14 +112,14 @@ class CacheService:
         value = await self.get(key)
         if value is not None:
             return value
-        
-        # Compute value
-        if callable(compute_fn):
-            if hasattr(compute_fn, "__await__"):
-                value = await compute_fn(*args, **kwargs)
-            else:
-                value = compute_fn(*args, **kwargs)
-        
+
+        # Compute value; async callables return an awaitable result —
+        # checking the result also covers partials and lambdas, which
+        # iscoroutinefunction misses
+        value = compute_fn(*args, **kwargs)
+        if inspect.isawaitable(value):
+            value = await value
+
         await self.set(key, value)
         return value
 
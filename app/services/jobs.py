@@ -5,9 +5,10 @@ import uuid
 from typing import Any
 
 import structlog
+from sqlalchemy import func
 
 from app.agents.graph import get_research_graph
-from app.agents.state import AgentState
+from app.agents.state import AgentState, merge_nested_dicts
 from app.core.config import get_settings
 from app.core.errors import classify_error
 from app.core.logging import get_logger
@@ -17,20 +18,34 @@ from app.db.session import get_session
 
 logger = get_logger(__name__)
 
+# State channels with a list reducer (operator.add in AgentState):
+# node outputs carry only the new entries, so merging a stream chunk
+# must append rather than overwrite
+_LIST_REDUCER_KEYS = ("pages", "entities", "errors")
+
+# Progress rows are pure overwrites, so commits are debounced: pollers
+# see updates at most this many seconds late instead of the job paying
+# one commit (and fsync) per graph node
+_PROGRESS_COMMIT_INTERVAL = 0.25
+
 
 class JobService:
     """Service for managing research jobs."""
 
+    def __init__(self) -> None:
+        """Initialize job service."""
+        # Settings are immutable; resolve once instead of per call
+        self.settings = get_settings()
+
     async def create_job(self, query: str) -> str:
         """Create a new research job.
-        
+
         Args:
             query: Research query
-            
+
         Returns:
             Job ID
         """
-        settings = get_settings()
         job_id = str(uuid.uuid4())
         trace_id = str(uuid.uuid4())
         
@@ -45,7 +60,7 @@ class JobService:
             await repo.create_job(
                 job_id=job_id,
                 query=query,
-                max_steps=settings.max_agent_steps,
+                max_steps=self.settings.max_agent_steps,
             )
         
         # Start job execution in background
@@ -65,87 +80,92 @@ class JobService:
         logger.info("job_execution_started")
         
         try:
-            # Update status to running
-            async with get_session() as session:
-                repo = ResearchJobRepository(session)
-                await repo.update_job_status(
-                    job_id=job_id,
-                    status=JobStatus.RUNNING,
-                    progress="Starting research workflow",
-                )
-            
             # Initialize state
-            settings = get_settings()
             initial_state: AgentState = {
                 "job_id": job_id,
                 "query": query,
                 "trace_id": trace_id,
                 "step_count": 0,
-                "max_steps": settings.max_agent_steps,
-                "max_urls": settings.max_urls,
+                "max_steps": self.settings.max_agent_steps,
+                "max_urls": self.settings.max_urls,
                 "errors": [],
                 "progress": "Initializing",
             }
-            
-            # Execute workflow with streaming to update progress in real-time
+
+            # Execute workflow with streaming to update progress in real-time.
+            # One session spans the whole stream: the ResearchJob row is
+            # loaded once, mutated in memory per node, and committed on a
+            # debounce instead of one SELECT+commit per node output.
             graph = get_research_graph()
-            final_state = initial_state
-            
-            async for chunk in graph.astream(initial_state):
-                # Each chunk contains the output from one node
-                for node_name, node_output in chunk.items():
-                    # Merge node output into final state
-                    final_state = {**final_state, **node_output}
-                    
-                    # Update database with current progress
-                    step_count = final_state.get("step_count", 0)
-                    progress = final_state.get("progress", "Processing...")
-                    
-                    async with get_session() as session:
-                        repo = ResearchJobRepository(session)
-                        await repo.update_job_status(
-                            job_id=job_id,
-                            status=JobStatus.RUNNING,
-                            progress=progress,
-                            step_count=step_count,
-                        )
-                    
-                    logger.info(
-                        "node_completed",
-                        node=node_name,
-                        step_count=step_count,
-                        progress=progress,
-                    )
-            
-            # Save results
+            # Own copy so in-place updates can't alias the dict handed to
+            # the graph; one dict grown in place instead of a fresh merge
+            # allocation per node output
+            final_state: dict[str, Any] = dict(initial_state)
+            loop = asyncio.get_running_loop()
+
             async with get_session() as session:
                 repo = ResearchJobRepository(session)
-                
-                # Save report if generated
+                job = await repo.update_job_status(
+                    job_id=job_id,
+                    status=JobStatus.RUNNING,
+                    progress="Starting research workflow",
+                )
+                await session.commit()
+                last_commit = loop.time()
+
+                async for chunk in graph.astream(initial_state):
+                    # Each chunk contains the output from one node
+                    for node_name, node_output in chunk.items():
+                        # Merge node output into final state, applying
+                        # the same reducers as the graph: list channels
+                        # accumulate and comparison_rows deep-merges,
+                        # everything else is a plain overwrite
+                        for key, value in node_output.items():
+                            if key in _LIST_REDUCER_KEYS:
+                                final_state[key] = final_state.get(key, []) + value
+                            elif key == "comparison_rows":
+                                final_state[key] = merge_nested_dicts(
+                                    final_state.get(key, {}), value
+                                )
+                            else:
+                                final_state[key] = value
+
+                        # Update the cached row with current progress
+                        step_count = final_state.get("step_count", 0)
+                        progress = final_state.get("progress", "Processing...")
+                        job.progress = progress
+                        job.step_count = step_count
+
+                        now = loop.time()
+                        if now - last_commit >= _PROGRESS_COMMIT_INTERVAL:
+                            await session.commit()
+                            last_commit = now
+
+                        logger.info(
+                            "node_completed",
+                            node=node_name,
+                            step_count=step_count,
+                            progress=progress,
+                        )
+
+                # Save results on the same row/session; the session
+                # context commits everything on exit
                 if final_state.get("report_md"):
-                    await repo.save_report(
-                        job_id=job_id,
-                        report_md=final_state["report_md"],
-                        report_json=final_state.get("report_json", {}),
-                    )
-                
-                # Update final status
+                    job.report_md = final_state["report_md"]
+                    job.report_json = final_state.get("report_json", {})
+                    logger.info("job_report_saved", job_id=job_id)
+
                 errors = final_state.get("errors", [])
-                if errors:
-                    await repo.update_job_status(
-                        job_id=job_id,
-                        status=JobStatus.COMPLETED,  # Completed with errors
-                        progress=f"Completed with {len(errors)} errors",
-                        step_count=final_state.get("step_count", 0),
-                    )
-                else:
-                    await repo.update_job_status(
-                        job_id=job_id,
-                        status=JobStatus.COMPLETED,
-                        progress="Completed successfully",
-                        step_count=final_state.get("step_count", 0),
-                    )
-            
+                job.status = JobStatus.COMPLETED  # Completed (with errors if any)
+                job.progress = (
+                    f"Completed with {len(errors)} errors"
+                    if errors
+                    else "Completed successfully"
+                )
+                job.step_count = final_state.get("step_count", 0)
+                # Server-side clock, consistent with created_at/updated_at
+                job.completed_at = func.now()
+
             logger.info(
                 "job_execution_completed",
                 step_count=final_state.get("step_count", 0),
@@ -158,7 +178,7 @@ class JobService:
             # Update status to failed
             async with get_session() as session:
                 repo = ResearchJobRepository(session)
-                await repo.update_job_status(
+                await repo.update_status_direct(
                     job_id=job_id,
                     status=JobStatus.FAILED,
                     progress="Job failed",
@@ -189,7 +209,7 @@ class JobService:
             job = await repo.get_job(job_id)
             
             return {
-                "job_id": job.job_id,
+                "job_id": str(job.job_id),
                 "query": job.query,
                 "status": job.status.value,
                 "progress": job.progress,
@@ -202,6 +222,19 @@ class JobService:
                 "completed_at": job.completed_at.isoformat() if job.completed_at else None,
             }
 
+    async def get_report_markdown(self, job_id: str) -> str | None:
+        """Get only the markdown report for a job.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            Markdown report, or None if not yet generated
+        """
+        async with get_session() as session:
+            repo = ResearchJobRepository(session)
+            return await repo.get_report_markdown(job_id)
+
     async def get_job_report(self, job_id: str) -> dict[str, Any]:
         """Get job report.
         
@@ -216,7 +249,7 @@ class JobService:
             job = await repo.get_job(job_id)
             
             return {
-                "job_id": job.job_id,
+                "job_id": str(job.job_id),
                 "query": job.query,
                 "status": job.status.value,
                 "report_md": job.report_md,
@@ -1,9 +1,13 @@
 """Reporting service for generating and exporting reports."""
 
+import asyncio
 import csv
 import io
-import json
-from typing import Any
+import os
+from pathlib import Path
+from typing import Any, TextIO
+
+import orjson
 
 from app.core.logging import get_logger
 
@@ -13,58 +17,91 @@ logger = get_logger(__name__)
 class ReportingService:
     """Service for generating and exporting reports in various formats."""
 
-    async def generate_csv(self, comparison_table: dict[str, dict[str, Any]]) -> str:
+    @staticmethod
+    def _render_row(
+        dimension: str,
+        products: dict[str, Any],
+        product_names: list[str],
+    ) -> list[Any]:
+        """Render one comparison-table row as CSV cell values.
+
+        Strings pass through untouched, lists/dicts become JSON, and
+        other scalars are left for csv.writer's own str() call.
+
+        Args:
+            dimension: Row dimension name
+            products: Product -> value mapping for this dimension
+            product_names: Column order
+
+        Returns:
+            Cell values, dimension first
+        """
+        dumps = orjson.dumps
+        return [dimension, *(
+            value if isinstance(value := products.get(product, "N/A"), str)
+            else dumps(value).decode() if isinstance(value, (list, dict))
+            else value
+            for product in product_names
+        )]
+
+    def _write_csv(self, out: TextIO, comparison_table: dict[str, dict[str, Any]]) -> None:
+        """Write the comparison table as CSV rows to a file object.
+
+        Writes directly to the target (file handle or StringIO) so large
+        tables never need a second in-memory copy.
+
+        Args:
+            out: Writable text file object
+            comparison_table: Comparison table data
+        """
+        product_names = sorted({
+            product for dim_data in comparison_table.values() for product in dim_data
+        })
+
+        writer = csv.writer(out)
+        writer.writerow(["Dimension"] + product_names)
+        # One C-level writerows call consumes the row generator — the
+        # interpreter never runs a per-cell append loop
+        writer.writerows(
+            self._render_row(dimension, products, product_names)
+            for dimension, products in comparison_table.items()
+        )
+
+    def generate_csv(self, comparison_table: dict[str, dict[str, Any]]) -> str:
         """Generate CSV from comparison table.
-        
+
         Args:
             comparison_table: Comparison table data
-            
+
         Returns:
             CSV string
         """
         if not comparison_table:
             return ""
-        
-        # Get all product names
-        product_names = set()
-        for dim_data in comparison_table.values():
-            product_names.update(dim_data.keys())
-        product_names = sorted(product_names)
-        
-        # Create CSV
+
         output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # Write header
-        writer.writerow(["Dimension"] + product_names)
-        
-        # Write rows
-        for dimension, products in comparison_table.items():
-            row = [dimension]
-            for product in product_names:
-                value = products.get(product, "N/A")
-                # Handle lists and dicts
-                if isinstance(value, (list, dict)):
-                    value = json.dumps(value)
-                row.append(str(value))
-            writer.writerow(row)
-        
+        self._write_csv(output, comparison_table)
         csv_content = output.getvalue()
         output.close()
-        
+
         logger.info("csv_generated", row_count=len(comparison_table))
         return csv_content
 
-    async def generate_json(self, report_data: dict[str, Any]) -> str:
+    def generate_json(self, report_data: dict[str, Any]) -> str:
         """Generate formatted JSON from report data.
-        
+
         Args:
             report_data: Report data
-            
+
         Returns:
             Formatted JSON string
         """
-        json_str = json.dumps(report_data, indent=2, ensure_ascii=False)
+        # orjson serializes dict-heavy payloads several times faster than
+        # stdlib json and emits UTF-8 directly (no ASCII escaping)
+        json_str = orjson.dumps(
+            report_data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        ).decode()
         logger.info("json_generated", size=len(json_str))
         return json_str
 
@@ -77,45 +114,54 @@ class ReportingService:
         output_dir: str = "./reports",
     ) -> dict[str, str]:
         """Save report files to disk.
-        
+
+        The three writes are independent, so each runs in its own worker
+        thread and they land concurrently — the save takes as long as the
+        slowest file, not the sum, and never blocks the event loop.
+
         Args:
             job_id: Job identifier
             report_md: Markdown report
             report_json: JSON report data
             comparison_table: Comparison table
             output_dir: Output directory
-            
+
         Returns:
             Dictionary of file paths
         """
-        import os
-        from pathlib import Path
-        
-        # Create output directory
         Path(output_dir).mkdir(parents=True, exist_ok=True)
-        
-        file_paths = {}
-        
-        # Save Markdown
+
         md_path = os.path.join(output_dir, f"{job_id}_report.md")
-        with open(md_path, "w", encoding="utf-8") as f:
-            f.write(report_md)
-        file_paths["markdown"] = md_path
-        
-        # Save JSON
         json_path = os.path.join(output_dir, f"{job_id}_report.json")
-        json_str = await self.generate_json(report_json)
-        with open(json_path, "w", encoding="utf-8") as f:
-            f.write(json_str)
-        file_paths["json"] = json_path
-        
-        # Save CSV
         csv_path = os.path.join(output_dir, f"{job_id}_comparison.csv")
-        csv_str = await self.generate_csv(comparison_table)
-        with open(csv_path, "w", encoding="utf-8", newline="") as f:
-            f.write(csv_str)
-        file_paths["csv"] = csv_path
-        
+
+        # orjson emits UTF-8 bytes — write them without decoding
+        json_bytes = orjson.dumps(
+            report_json,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        )
+
+        def _write_markdown() -> None:
+            with open(md_path, "w", encoding="utf-8") as f:
+                f.write(report_md)
+
+        def _write_json() -> None:
+            with open(json_path, "wb") as f:
+                f.write(json_bytes)
+
+        def _write_csv_file() -> None:
+            # Rows go straight to the file handle, no string copy
+            with open(csv_path, "w", encoding="utf-8", newline="") as f:
+                if comparison_table:
+                    self._write_csv(f, comparison_table)
+
+        await asyncio.gather(
+            asyncio.to_thread(_write_markdown),
+            asyncio.to_thread(_write_json),
+            asyncio.to_thread(_write_csv_file),
+        )
+
+        file_paths = {"markdown": md_path, "json": json_path, "csv": csv_path}
         logger.info("report_files_saved", job_id=job_id, file_count=len(file_paths))
         return file_paths
 
@@ -126,7 +172,7 @@ _reporting_service: ReportingService | None = None
 
 def get_reporting_service() -> ReportingService:
     """Get the global reporting service instance.
-    
+
     Returns:
         ReportingService: Global reporting service
     """
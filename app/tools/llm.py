@@ -1,10 +1,14 @@
 """LLM wrapper with retry and structured output support."""
 
+import asyncio
+import functools
 import json
 from typing import Any, TypeVar
 
+import httpx
 from openai import AsyncOpenAI
-from pydantic import BaseModel
+from openai.types.chat import ChatCompletionMessageParam
+from pydantic import BaseModel, TypeAdapter
 
 from app.core.config import get_settings
 from app.core.errors import LLMError
@@ -16,19 +20,124 @@ logger = get_logger(__name__)
 T = TypeVar("T", bound=BaseModel)
 
 
+@functools.lru_cache(maxsize=None)
+def get_type_adapter(response_model: type[BaseModel]) -> TypeAdapter[Any]:
+    """Get a prebuilt TypeAdapter for a response model.
+
+    Building the adapter (and its core validator/serializer) once per model
+    class amortizes Pydantic schema construction across requests.
+
+    Args:
+        response_model: Pydantic model class
+
+    Returns:
+        Cached TypeAdapter for the model
+    """
+    return TypeAdapter(response_model)
+
+
+@functools.lru_cache(maxsize=None)
+def _strict_schema_compatible(response_model: type[BaseModel]) -> bool:
+    """Whether a model can use OpenAI strict structured outputs.
+
+    Strict mode requires every object in the schema to close with
+    additionalProperties: false. Dict-valued fields compile to open
+    objects, which the API rejects with a 400, so models containing
+    them must use json_object mode instead.
+
+    Args:
+        response_model: Pydantic model class
+
+    Returns:
+        True if the model's JSON schema is valid for strict mode
+    """
+    def _closed(node: object) -> bool:
+        if isinstance(node, dict):
+            if node.get("type") == "object":
+                extra = node.get("additionalProperties")
+                if extra not in (False, None) or (
+                    extra is not False and "properties" not in node
+                ):
+                    return False
+            return all(_closed(value) for value in node.values())
+        if isinstance(node, list):
+            return all(_closed(value) for value in node)
+        return True
+
+    return _closed(response_model.model_json_schema())
+
+
+@functools.lru_cache(maxsize=None)
+def _schema_prompt_block(response_model: type[BaseModel]) -> str:
+    """Render the json_object-mode instructions for a model once.
+
+    Only used for models that cannot go through strict structured
+    outputs (see _strict_schema_compatible). The schema walk, field
+    hints, and instruction scaffolding are all static per model class,
+    so the whole block is cached and only the user prompt is composed
+    per call.
+
+    Args:
+        response_model: Pydantic model class
+
+    Returns:
+        Instruction block appended to structured-output prompts
+    """
+    schema = response_model.model_json_schema()
+    properties = schema.get("properties", {})
+
+    fields_desc = []
+    for field_name, field_info in properties.items():
+        field_type = field_info.get("type", "string")
+        if field_type == "array":
+            item_type = field_info.get("items", {}).get("type", "string")
+            fields_desc.append(f'  "{field_name}": [{item_type}, {item_type}, ...]')
+        else:
+            fields_desc.append(f'  "{field_name}": <{field_type}>')
+
+    fields_str = ",\n".join(fields_desc)
+    return f"""You MUST respond with a JSON object containing actual data values. The JSON structure should be:
+{{
+{fields_str}
+}}
+
+IMPORTANT:
+- Fill in ACTUAL VALUES based on the research query, not schema descriptions
+- Each array should contain real strings/values, not type definitions
+- Do NOT return the schema itself, return data that matches the schema
+
+Return ONLY the JSON object with real data, no additional text."""
+
+
 class LLMClient:
     """OpenAI LLM client with retry and structured output."""
 
     def __init__(self) -> None:
         """Initialize LLM client."""
         settings = get_settings()
+        # Shared connection pool with keep-alive: all LLM calls in a process
+        # reuse warm TCP+TLS connections instead of handshaking per request,
+        # and HTTP/2 multiplexes concurrent calls over each connection
+        self._http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=50,
+                max_keepalive_connections=20,
+                keepalive_expiry=60,
+            ),
+            timeout=httpx.Timeout(60.0),
+        )
         # Support custom API base URL for proxies
         self.client = AsyncOpenAI(
             api_key=settings.openai_api_key,
             base_url=settings.openai_api_base,  # Will be None if not set, defaults to OpenAI
+            http_client=self._http_client,
         )
         self.model = settings.openai_model
         self.max_tokens = settings.openai_max_tokens
+        # Global bound on in-flight requests; callers fan out freely
+        # (asyncio.gather / Send branches) without tripping provider RPM
+        self._semaphore = asyncio.Semaphore(settings.llm_concurrency)
 
     @retry_on_llm_error
     async def generate_text(
@@ -51,17 +160,18 @@ class LLMClient:
             LLMError: If generation fails
         """
         try:
-            messages: list[dict[str, str]] = []
+            messages: list[ChatCompletionMessageParam] = []
             if system_prompt:
                 messages.append({"role": "system", "content": system_prompt})
             messages.append({"role": "user", "content": prompt})
 
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=temperature,
-                max_tokens=self.max_tokens,
-            )
+            async with self._semaphore:
+                response = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=self.max_tokens,
+                )
             
             content = response.choices[0].message.content
             if content is None:
@@ -87,72 +197,77 @@ class LLMClient:
         system_prompt: str | None = None,
     ) -> T:
         """Generate structured output using Pydantic model.
-        
+
+        Uses OpenAI structured outputs (constrained decoding) where the
+        model's schema allows it: the schema is enforced server-side, so
+        there is no hand-built schema prompt to pay tokens for and no
+        malformed-JSON retries. Models with dict-valued fields compile
+        to open schemas that strict mode rejects, so those fall back to
+        json_object mode with prompt hints and client-side validation.
+
         Args:
             prompt: User prompt
             response_model: Pydantic model for response
             system_prompt: Optional system prompt
-            
+
         Returns:
             Parsed Pydantic model instance
-            
+
         Raises:
             LLMError: If generation or parsing fails
         """
         try:
-            messages: list[dict[str, str]] = []
+            messages: list[ChatCompletionMessageParam] = []
             if system_prompt:
                 messages.append({"role": "system", "content": system_prompt})
-            
-            # Add JSON schema instruction with clear examples
-            schema = response_model.model_json_schema()
-            # Remove 'description' and 'title' to reduce confusion
-            properties = schema.get("properties", {})
-            required = schema.get("required", [])
-            
-            # Build a cleaner schema representation
-            fields_desc = []
-            for field_name, field_info in properties.items():
-                field_type = field_info.get("type", "string")
-                if field_type == "array":
-                    item_type = field_info.get("items", {}).get("type", "string")
-                    fields_desc.append(f'  "{field_name}": [{item_type}, {item_type}, ...]')
-                else:
-                    fields_desc.append(f'  "{field_name}": <{field_type}>')
-            
-            fields_str = ",\n".join(fields_desc)
-            
-            enhanced_prompt = f"""{prompt}
 
-You MUST respond with a JSON object containing actual data values. The JSON structure should be:
-{{
-{fields_str}
-}}
+            if _strict_schema_compatible(response_model):
+                messages.append({"role": "user", "content": prompt})
 
-IMPORTANT:
-- Fill in ACTUAL VALUES based on the research query, not schema descriptions
-- Each array should contain real strings/values, not type definitions
-- Do NOT return the schema itself, return data that matches the schema
+                async with self._semaphore:
+                    response = await self.client.chat.completions.parse(
+                        model=self.model,
+                        messages=messages,
+                        temperature=0.3,  # Lower temperature for structured output
+                        max_tokens=self.max_tokens,
+                        response_format=response_model,
+                    )
 
-Return ONLY the JSON object with real data, no additional text."""
-            
-            messages.append({"role": "user", "content": enhanced_prompt})
+                parsed = response.choices[0].message.parsed
+                if parsed is None:
+                    raise LLMError("Empty response from LLM")
+            else:
+                # The instruction block is static per model — cached render
+                messages.append(
+                    {"role": "user", "content": f"{prompt}\n\n{_schema_prompt_block(response_model)}"}
+                )
+
+                # Stream the completion and accumulate deltas as they
+                # arrive: network receive overlaps with chunk handling
+                # instead of waiting for the full buffered JSON payload
+                parts: list[str] = []
+                async with self._semaphore:
+                    stream = await self.client.chat.completions.create(
+                        model=self.model,
+                        messages=messages,
+                        temperature=0.3,  # Lower temperature for structured output
+                        max_tokens=self.max_tokens,
+                        response_format={"type": "json_object"},
+                        stream=True,
+                    )
+                    async for chunk in stream:
+                        if chunk.choices:
+                            delta = chunk.choices[0].delta.content
+                            if delta:
+                                parts.append(delta)
+
+                content = "".join(parts)
+                if not content:
+                    raise LLMError("Empty response from LLM")
+
+                # Parse JSON and validate with the prebuilt adapter
+                parsed = get_type_adapter(response_model).validate_json(content)
 
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=0.3,  # Lower temperature for structured output
-                max_tokens=self.max_tokens,
-                response_format={"type": "json_object"},
-            )
-            
-            content = response.choices[0].message.content
-            if content is None:
-                raise LLMError("Empty response from LLM")
-            
-            # Parse JSON and validate with Pydantic
-            parsed = response_model.model_validate_json(content)
-            
             logger.info(
                 "llm_structured_generation_success",
                 model=self.model,
@@ -164,6 +279,10 @@ Return ONLY the JSON object with real data, no additional text."""
             logger.error("llm_structured_generation_failed", error=str(e))
             raise LLMError(f"Structured generation failed: {e}") from e
 
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._http_client.aclose()
+
 
 # Global LLM client instance
 _llm_client: LLMClient | None = None
@@ -171,7 +290,7 @@ _llm_client: LLMClient | None = None
 
 def get_llm_client() -> LLMClient:
     """Get the global LLM client instance.
-    
+
     Returns:
         LLMClient: Global LLM client
     """
@@ -179,3 +298,11 @@ def get_llm_client() -> LLMClient:
     if _llm_client is None:
         _llm_client = LLMClient()
     return _llm_client
+
+
+async def close_llm_client() -> None:
+    """Close the global LLM client's connection pool (app shutdown)."""
+    global _llm_client
+    if _llm_client is not None:
+        await _llm_client.aclose()
+        _llm_client = None
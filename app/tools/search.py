@@ -1,16 +1,36 @@
 """Web search tool using DuckDuckGo with region support."""
 
 import asyncio
+import re
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
+from typing import Any
+from urllib.parse import parse_qsl, urlsplit, urlunsplit
 
 from duckduckgo_search import DDGS
 
 from pydantic import BaseModel, Field
 
+from app.core.config import get_settings
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# One DDGS client per executor thread: reuses the underlying HTTP
+# connection across searches without sharing state between threads
+_thread_local = threading.local()
+
+
+def _get_ddgs() -> DDGS:
+    """Get (or create) this thread's DDGS client."""
+    ddgs = getattr(_thread_local, "ddgs", None)
+    if ddgs is None:
+        ddgs = _thread_local.ddgs = DDGS()
+    return ddgs
+
 
 class SearchResult(BaseModel):
     """Search result model."""
@@ -47,17 +67,96 @@ BLOCKED_DOMAINS = {
 }
 
 
+# Matches a blocked domain or any subdomain of one, anchored at the end
+# of the host — one linear regex scan instead of a substring test per
+# blocklist entry (which also wrongly matched e.g. "myreddit.com")
+_BLOCKED_DOMAIN_RE = re.compile(
+    r"(?:^|\.)(?:" + "|".join(map(re.escape, sorted(BLOCKED_DOMAINS))) + r")$"
+)
+
+
+# Common tracking parameters that never change page content
+_TRACKING_PARAMS = {"gclid", "fbclid", "igshid", "spm", "ref", "source"}
+
+
+def canonicalize_url(url: str) -> str:
+    """Canonicalize a URL for deduplication.
+
+    Lowercases scheme and host, strips default ports and fragments, drops
+    tracking parameters (utm_*, gclid, ...) and sorts the remaining query
+    so query-string variants of the same page collapse to one key.
+
+    Args:
+        url: Raw URL from search results
+
+    Returns:
+        Canonical form for dedup (original URL should be kept for display)
+    """
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    netloc = parts.netloc.lower()
+    if (parts.scheme == "http" and netloc.endswith(":80")) or (
+        parts.scheme == "https" and netloc.endswith(":443")
+    ):
+        netloc = netloc.rsplit(":", 1)[0]
+    query = "&".join(sorted(
+        f"{k}={v}"
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k not in _TRACKING_PARAMS and not k.startswith("utm_")
+    ))
+    return urlunsplit((parts.scheme.lower(), netloc, parts.path or "/", query, ""))
+
+
 def is_accessible_url(url: str) -> bool:
     """Check if URL is likely accessible (not from blocked domains)."""
-    for domain in BLOCKED_DOMAINS:
-        if domain in url:
-            return False
-    return True
+    try:
+        host = urlsplit(url).hostname or ""
+    except ValueError:
+        return False
+    return _BLOCKED_DOMAIN_RE.search(host) is None
 
 
 class SearchTool:
     """Web search tool using DuckDuckGo."""
 
+    _WHITESPACE_RE = re.compile(r"\s+")
+    _CACHE_MAX_ENTRIES = 1024
+
+    def __init__(self) -> None:
+        """Initialize search tool."""
+        settings = get_settings()
+        # Bound concurrent searches so batch fan-out cannot flood the
+        # executor or the provider
+        self._semaphore = asyncio.Semaphore(settings.search_concurrency)
+        # Dedicated executor for DDGS calls: sized to the semaphore so
+        # searches never queue behind unrelated default-executor work
+        self._executor = ThreadPoolExecutor(
+            max_workers=settings.search_concurrency, thread_name_prefix="ddgs"
+        )
+        # In-process TTL cache: repeat keywords skip the provider entirely
+        self._cache_enabled = settings.cache_enabled
+        self._cache_ttl = settings.cache_ttl_seconds
+        self._cache: dict[tuple[str, int], tuple[float, list[SearchResult]]] = {}
+
+    def _cache_get(self, key: tuple[str, int]) -> list[SearchResult] | None:
+        """Get unexpired cached results for a normalized query key."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, results = entry
+        if time.monotonic() >= expires_at:
+            del self._cache[key]
+            return None
+        return results
+
+    def _cache_set(self, key: tuple[str, int], results: list[SearchResult]) -> None:
+        """Cache results for a normalized query key, evicting the oldest."""
+        if len(self._cache) >= self._CACHE_MAX_ENTRIES:
+            self._cache.pop(next(iter(self._cache)))
+        self._cache[key] = (time.monotonic() + self._cache_ttl, results)
+
     async def search(
         self,
         query: str,
@@ -74,32 +173,51 @@ class SearchTool:
         Returns:
             List of search results
         """
+        cache_key = (self._WHITESPACE_RE.sub(" ", query).strip().lower(), max_results)
+        if self._cache_enabled:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                logger.info("search_cache_hit", query=query, result_count=len(cached))
+                return cached
+
         logger.info("search_started", query=query, max_results=max_results)
-        
-        results = []
-        seen_urls = set()
+
+        results: list[SearchResult] = []
+        seen_urls: set[str] = set()
         
         try:
-            # Create a fresh DDGS instance for each search to avoid state issues
-            loop = asyncio.get_event_loop()
-            
-            def _do_search(q: str, **kwargs) -> list:
+            loop = asyncio.get_running_loop()
+
+            def _do_search(q: str, **kwargs: Any) -> list[dict[str, Any]]:
                 """Helper function to perform search in executor."""
                 try:
-                    ddgs = DDGS()
-                    raw = list(ddgs.text(q, **kwargs))
+                    raw = list(_get_ddgs().text(q, **kwargs))
                     logger.info("ddgs_raw_results", query=q, count=len(raw))
                     return raw
                 except Exception as e:
+                    # Drop this thread's client — a fresh one is built on
+                    # the next search instead of reusing broken state
+                    _thread_local.ddgs = None
                     logger.error("ddgs_search_error", query=q, error=str(e), error_type=type(e).__name__)
                     return []
-            
-            # 1. Default search
-            raw_results = await loop.run_in_executor(
-                None,
-                partial(_do_search, query, max_results=max_results * 2)
+
+            async def run_search(
+                fn: Callable[[], list[dict[str, Any]]],
+            ) -> list[dict[str, Any]]:
+                async with self._semaphore:
+                    return await loop.run_in_executor(self._executor, fn)
+
+            # Issue the default and English searches concurrently — they
+            # are independent calls, so the second is speculative and
+            # costs latency only when the provider is the bottleneck
+            en_query = f"{query} review comparison analysis"
+            raw_results, en_results = await asyncio.gather(
+                run_search(partial(_do_search, query, max_results=max_results * 2)),
+                run_search(
+                    partial(_do_search, en_query, region="wt-wt", max_results=max_results)
+                ),
             )
-            
+
             for item in raw_results:
                 url = item.get("href", item.get("link", ""))
                 if url and url not in seen_urls and is_accessible_url(url):
@@ -112,15 +230,9 @@ class SearchTool:
                     ))
                     if len(results) >= max_results:
                         break
-            
-            # 2. If not enough results, try English search
+
+            # 2. If not enough results, merge in the English search
             if len(results) < max_results // 2:
-                en_query = f"{query} review comparison analysis"
-                en_results = await loop.run_in_executor(
-                    None,
-                    partial(_do_search, en_query, region="wt-wt", max_results=max_results)
-                )
-                
                 for item in en_results:
                     url = item.get("href", item.get("link", ""))
                     if url and url not in seen_urls and is_accessible_url(url):
@@ -135,17 +247,42 @@ class SearchTool:
                             break
             
             logger.info(
-                "search_completed", 
-                query=query, 
+                "search_completed",
+                query=query,
                 result_count=len(results),
                 filtered_blocked=len(seen_urls) - len(results),
             )
+            if self._cache_enabled and results:
+                self._cache_set(cache_key, results)
             return results
             
         except Exception as e:
             logger.error("search_failed", query=query, error=str(e), error_type=type(e).__name__)
             return []
 
+    async def batch_search(
+        self,
+        queries: list[str],
+        max_results: int = 10,
+    ) -> list[list[SearchResult] | BaseException]:
+        """Search several queries in one call.
+
+        DuckDuckGo has no native multi-query endpoint, so this fans out with
+        asyncio.gather — one call site, N concurrent searches. Failed queries
+        come back as exceptions for the caller to handle per-keyword.
+
+        Args:
+            queries: Search queries
+            max_results: Maximum number of results per query
+
+        Returns:
+            One result list (or exception) per query, in input order
+        """
+        return await asyncio.gather(
+            *(self.search(query=query, max_results=max_results) for query in queries),
+            return_exceptions=True,
+        )
+
 
 # Global search tool instance
 _search_tool: SearchTool | None = None